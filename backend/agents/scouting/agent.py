@@ -11,12 +11,12 @@ Follows architecture principles:
 - Business logic decoupled from data provider
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 from logging import Logger, getLogger
 # Absolute import - assumes backend directory is on PYTHONPATH
 from common.base_agent import BaseAgent
-from common.cache import get_cache
+from common.cache import Cache, get_cache
 
 logger = logging.getLogger(__name__)
 from .schemas import (
@@ -38,16 +38,18 @@ class ScoutingAgent(BaseAgent):
     Conforms to BaseAgent contract.
     """
     
-    def __init__(self, data_provider: StockDataProvider = None):
+    def __init__(self, data_provider: StockDataProvider = None, cache: Optional[Cache] = None):
         """
         Initialize the Scouting Agent.
         
         Args:
             data_provider: Optional data provider instance (defaults to YahooFinanceProvider)
+            cache: Optional result cache (defaults to the process-wide cache)
         """
         super().__init__(agent_name="scouting_agent")
         # Inject data provider dependency (business logic doesn't depend on specific provider)
         self.data_provider = data_provider or YahooFinanceProvider()
+        self.cache = cache if cache is not None else get_cache()
     
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """
@@ -84,7 +86,7 @@ class ScoutingAgent(BaseAgent):
         logger.info(f"Scouting input - top_n: {scouting_input.top_n}")
         
         # Check cache (valid for 3 hours)
-        cache = get_cache()
+        cache = self.cache
         cache_key = cache.generate_key('scouting', top_n=scouting_input.top_n)
         
         cached_result = cache.get(cache_key)
@@ -152,6 +154,36 @@ def create_agent(config: Dict[str, Any] = None) -> ScoutingAgent:
     return ScoutingAgent(data_provider=data_provider)
 
 
+def post_execution_hook(result) -> None:
+    """
+    Log a summary of the scouting results.
+    Registered by the orchestrator as this agent's post-execution hook.
+    
+    Args:
+        result: AgentExecutionResult of the scouting agent
+    """
+    # Skipped entirely unless INFO is enabled
+    if result.status != 'success' or not result.data or not logger.isEnabledFor(logging.INFO):
+        return
+    
+    logger.info("\n" + "="*80)
+    logger.info("SCOUTING AGENT RESULTS")
+    logger.info("="*80)
+    data = result.data
+    logger.info(f"Total Screened: {data.get('total_screened', 0)}")
+    logger.info(f"Qualifying Stocks: {data.get('qualifying_count', 0)}")
+    shortlisted = data.get('shortlisted_stocks', [])
+    logger.info(f"Shortlisted Stocks: {len(shortlisted)}")
+    logger.info("-"*80)
+    for i, stock in enumerate(shortlisted[:10], 1):
+        logger.info(f"{i}. {stock.get('name', 'N/A')} ({stock.get('symbol', 'N/A')})")
+        logger.info(f"   Price: ₹{stock.get('current_price', 0):.2f}")
+        logger.info(f"   ATR: {stock.get('atr_percentage', 0):.2f}%" if stock.get('atr_percentage') else "   ATR: N/A")
+        logger.info(f"   Avg Volume: {stock.get('avg_volume', 0):,.0f}")
+        logger.info(f"   Meets Criteria: {'Yes' if stock.get('meets_criteria') else 'No'}")
+    logger.info("="*80 + "\n")
+
+
 # For backward compatibility and direct execution
 if __name__ == "__main__":
     agent = ScoutingAgent()
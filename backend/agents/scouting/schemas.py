@@ -3,14 +3,20 @@ Scouting Agent Schemas
 Defines input and output contracts for the scouting agent.
 """
 
+import sys
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from logging import Logger, getLogger
+from common.compat import DATACLASS_SLOTS
 
 logger = getLogger(__name__)
 
-@dataclass
+# Allowed range for ScoutingAgentInput.top_n
+MIN_TOP_N = 1
+MAX_TOP_N = 50
+
+@dataclass(**DATACLASS_SLOTS)
 class StockScreeningResult:
     """Schema for individual stock screening result."""
     symbol: str
@@ -24,14 +30,29 @@ class StockScreeningResult:
     criteria_details: List[str]
     score: Optional[float] = None
     
+    def __post_init__(self):
+        # Symbols key dicts/sets across every agent; interning makes repeat
+        # lookups of the same symbol a pointer comparison
+        self.symbol = sys.intern(self.symbol)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        result = asdict(self)
-        # Handle Optional fields
-        if result['atr_percentage'] is None:
-            result['atr_percentage'] = None
-        if result['score'] is None:
-            result.pop('score', None)
+        # Literal dict instead of asdict(): one allocation, no per-field reflection.
+        # criteria_details is copied, as asdict() would.
+        result = {
+            'symbol': self.symbol,
+            'name': self.name,
+            'current_price': self.current_price,
+            'atr_percentage': self.atr_percentage,
+            'avg_volume': self.avg_volume,
+            'recent_volume': self.recent_volume,
+            'volume_ratio': self.volume_ratio,
+            'meets_criteria': self.meets_criteria,
+            'criteria_details': list(self.criteria_details)
+        }
+        # Omit score when it was never computed
+        if self.score is not None:
+            result['score'] = self.score
         return result
 
 
@@ -55,11 +76,7 @@ class ScoutingAgentInput:
     
     def validate(self) -> bool:
         """Validate input data."""
-        if not isinstance(self.top_n, int):
-            return False
-        if self.top_n < 1 or self.top_n > 50:
-            return False
-        return True
+        return isinstance(self.top_n, int) and MIN_TOP_N <= self.top_n <= MAX_TOP_N
 
 
 @dataclass
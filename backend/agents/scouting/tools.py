@@ -6,6 +6,7 @@ No side effects, stateless, and deterministic.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from .data_provider import StockDataProvider, YahooFinanceProvider
 from .schemas import StockScreeningResult
@@ -55,22 +56,18 @@ def calculate_atr(data: pd.DataFrame, period: int = 14) -> Optional[float]:
     if data is None or len(data) < period + 1:
         return None
     
-    high = data['High'].values
-    low = data['Low'].values
-    close = data['Close'].values
+    # Only the last `period` true ranges are averaged, so compute just those,
+    # vectorized: each bar's range against the previous bar's close
+    high = data['High'].values[-period:]
+    low = data['Low'].values[-period:]
+    prev_close = data['Close'].values[-period - 1:-1]
     
-    tr_list = []
-    for i in range(1, len(data)):
-        tr1 = high[i] - low[i]
-        tr2 = abs(high[i] - close[i-1])
-        tr3 = abs(low[i] - close[i-1])
-        tr = max(tr1, tr2, tr3)
-        tr_list.append(tr)
-    
-    if len(tr_list) < period:
-        return None
+    true_range = np.maximum(
+        high - low,
+        np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
     
-    atr = np.mean(tr_list[-period:])
+    atr = np.mean(true_range)
     return float(atr)
 
 
@@ -216,28 +213,34 @@ def screen_stock(
 
 def screen_stocks(
     symbols: List[str],
-    data_provider: StockDataProvider
+    data_provider: StockDataProvider,
+    max_workers: int = 8
 ) -> List[StockScreeningResult]:
     """
     Screens multiple stocks.
     Pure function - no side effects.
+    Each screen is dominated by the price-history fetch, so symbols are
+    screened concurrently in a thread pool; results keep the input order.
     
     Args:
         symbols: List of stock symbols to screen
         data_provider: Data provider instance
+        max_workers: Maximum number of concurrent fetches
     
     Returns:
         List of screening results
     """
-    results = []
     logger.info(f"Screening {len(symbols)} stocks")
     logger.debug(f"Symbols: {symbols}")
-    for symbol in symbols:
-        result = screen_stock(symbol, data_provider)
-        if result:
-            results.append(result)
     
-    return results
+    if len(symbols) <= 1 or max_workers <= 1:
+        screened = [screen_stock(symbol, data_provider) for symbol in symbols]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols)),
+                                thread_name_prefix="scouting-fetch") as executor:
+            screened = list(executor.map(lambda symbol: screen_stock(symbol, data_provider), symbols))
+    
+    return [result for result in screened if result]
 
 
 def calculate_score(stock: StockScreeningResult) -> float:
@@ -4,8 +4,8 @@ Defines tools that the sentiment agent can call autonomously.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Callable
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Callable, FrozenSet
+from dataclasses import dataclass, field
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,11 @@ class Tool:
     description: str
     parameters: Dict[str, Any]  # JSON schema for parameters
     function: Callable
+    # Required argument names from the parameters schema, resolved once at construction
+    required: FrozenSet[str] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.required = frozenset(self.parameters.get("required", ()))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert tool to dictionary for LLM function calling."""
@@ -49,15 +54,21 @@ class ToolRegistry:
     
     def call_tool(self, name: str, **kwargs) -> Any:
         """Call a tool by name with arguments."""
-        tool = self.get_tool(name)
-        if not tool:
-            raise ValueError(f"Tool '{name}' not found")
+        # Single dict probe on the hit path; the miss is the exceptional case
+        try:
+            tool = self.tools[name]
+        except KeyError:
+            raise ValueError(f"Tool '{name}' not found") from None
+        
+        missing = tool.required.difference(kwargs)
+        if missing:
+            raise ValueError(f"Tool '{name}' missing required arguments: {sorted(missing)}")
         
-        logger.info(f"Agent calling tool: {name} with args: {kwargs}")
+        logger.info("Agent calling tool: %s with args: %s", name, kwargs)
         try:
             result = tool.function(**kwargs)
-            logger.info(f"Tool {name} executed successfully")
+            logger.info("Tool %s executed successfully", name)
             return result
         except Exception as e:
-            logger.error(f"Error calling tool {name}: {e}", exc_info=True)
+            logger.error("Error calling tool %s: %s", name, e, exc_info=True)
             raise
@@ -13,7 +13,7 @@ import json
 from pathlib import Path
 from dotenv import load_dotenv
 from groq import Groq
-from common.base_agent import BaseAgent
+from common.base_agent import BaseAgent, raise_if_cancelled
 
 # Load environment variables from .env file
 env_path = Path(__file__).parent.parent.parent / '.env'
@@ -32,7 +32,7 @@ from .social_media_tools import (
     fetch_gnews_articles,
     SocialMention
 )
-from common.cache import get_cache
+from common.cache import Cache, get_cache
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +49,8 @@ class SentimentAgent(BaseAgent):
         groq_api_key: Optional[str] = None,
         groq_model_name: str = "qwen/qwen3-32b",
         min_news_threshold: int = 5,
-        max_expansion_months: int = 6
+        max_expansion_months: int = 6,
+        cache: Optional[Cache] = None
     ):
         """
         Initialize the Sentiment Agent.
@@ -60,11 +61,13 @@ class SentimentAgent(BaseAgent):
             groq_model_name: Groq model name (default: "qwen/qwen3-32b")
             min_news_threshold: Minimum number of articles needed for analysis (default: 5)
             max_expansion_months: Maximum months to expand search (default: 6)
+            cache: Optional result cache (defaults to the process-wide cache)
         """
         super().__init__(agent_name="sentiment_agent")
         self.groq_model_name = groq_model_name
         self.min_news_threshold = min_news_threshold
         self.max_expansion_months = max_expansion_months
+        self.cache = cache if cache is not None else get_cache()
         
         # Initialize Groq client
         if groq_client:
@@ -335,6 +338,8 @@ Respond STRICTLY in JSON with this structure:
         
         # Agentic loop: reason and collect until sufficient
         for iteration in range(1, max_iterations + 1):
+            raise_if_cancelled()
+            
             # Agent reasons about sufficiency
             decision = self._reason_about_data_sufficiency(
                 symbol, company_name, len(all_articles), current_days
@@ -401,7 +406,7 @@ Respond STRICTLY in JSON with this structure:
             logger.debug(f"Sample stock structure: {stocks[0]}")
         
         # Check cache (valid for 3 hours)
-        cache = get_cache()
+        cache = self.cache
         # Create cache key from stock symbols (sorted for consistency)
         stock_symbols = sorted([s.get('symbol', '') for s in stocks if s.get('symbol')])
         cache_key = cache.generate_key('sentiment', stocks=','.join(stock_symbols))
@@ -416,6 +421,8 @@ Respond STRICTLY in JSON with this structure:
         # Analyze each stock
         analyzed_stocks = []
         for stock_data in stocks:
+            raise_if_cancelled()
+            
             symbol = stock_data.get('symbol')
             name = stock_data.get('name', symbol)
             
@@ -26,6 +26,9 @@ from .kite_client import KiteClient
 
 logger = logging.getLogger(__name__)
 
+# Sentiment labels that count as a bullish signal for the Groq pre-filter
+BULLISH_SENTIMENTS = ('positive', 'very_positive')
+
 
 class StrategistAgent(BaseAgent):
     """
@@ -94,6 +97,9 @@ class StrategistAgent(BaseAgent):
         
         Returns:
             List of TradingDecision objects
+        
+        Raises:
+            Exception: If the Groq request fails or its response cannot be parsed
         """
         logger.info("Strategist agent making trading decisions...")
         
@@ -127,12 +133,38 @@ class StrategistAgent(BaseAgent):
                 }
             })
         logger.info("Combined %d stocks", len(combined_stocks))
-        logger.info("Combined stocks payload: %s", json.dumps(combined_stocks, indent=2))
-        logger.info("================================================")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Combined stocks payload: %s", json.dumps(combined_stocks, indent=2))
         if not combined_stocks:
             logger.warning("No stocks to analyze")
             return []
         
+        # Pre-filter obvious holds: without a bullish trend or positive sentiment
+        # a stock can never clear the buy threshold, so don't spend tokens on it
+        candidates = []
+        prefiltered_decisions = []
+        for stock in combined_stocks:
+            if (stock['technical']['trend'] == 'bullish' or
+                    stock['sentiment']['overall_sentiment'] in BULLISH_SENTIMENTS):
+                candidates.append(stock)
+            else:
+                prefiltered_decisions.append(TradingDecision(
+                    symbol=stock['symbol'],
+                    name=stock['name'],
+                    action='hold',
+                    confidence=0.0,
+                    reasoning='pre-filtered: no bullish signal',
+                    technical_score=float(stock['technical']['strength'] or 0),
+                    sentiment_score=float(stock['sentiment']['sentiment_score'] or 0),
+                    combined_score=0.0
+                ))
+        logger.info(
+            "Pre-filtered %d/%d stocks as hold, sending %d candidates to Groq",
+            len(prefiltered_decisions), len(combined_stocks), len(candidates)
+        )
+        if not candidates:
+            return prefiltered_decisions
+        
         # Create prompt for Groq
         prompt = f"""You are a senior trading strategist making buy/sell/hold decisions for a swing trading system.
 
@@ -146,7 +178,7 @@ IMPORTANT PRINCIPLES:
 5. Consider risk-reward ratio 1:2
 
 Stocks to analyze:
-{json.dumps(combined_stocks, indent=2)}
+{json.dumps(candidates, indent=2)}
 
 For each stock, provide:
 1. Action: 'buy', 'hold', or 'sell'
@@ -177,6 +209,7 @@ Respond in JSON format:
 }}"""
 
         try:
+            # JSON mode does not support streaming, so request the full completion
             completion = self.groq_client.chat.completions.create(
                 model=self.groq_model_name,
                 messages=[{"role": "user", "content": prompt}],
@@ -185,10 +218,7 @@ Respond in JSON format:
             )
             
             response_text = completion.choices[0].message.content
-            logger.info("================================================")
-            logger.info(f"response_text: {response_text}")
-            logger.info(f"Strategist reasoning response received ")
-            logger.info("================================================")
+            logger.debug("Strategist response_text: %s", response_text)
             
             # Parse response
             data = json.loads(response_text)
@@ -211,12 +241,14 @@ Respond in JSON format:
                 )
                 decisions.append(decision)
             
-            logger.info(f"Made {len(decisions)} trading decisions")
-            return decisions
+            logger.info("Made %d trading decisions", len(decisions))
+            return decisions + prefiltered_decisions
             
         except Exception as e:
+            # Don't fall back to the pre-filtered holds: that would report a
+            # successful all-hold run when the candidates were never evaluated
             logger.error(f"Error making trading decisions: {e}", exc_info=True)
-            return []
+            raise
     
     def _execute_buy_order(self, decision: TradingDecision) -> Dict[str, Any]:
         """
@@ -332,7 +364,16 @@ Respond in JSON format:
             execution_reason=execution_reason
         )
         
-        logger.info(f"Strategist execution complete. Decisions: {len(decisions)}, Order executed: {order_executed}")
+        top_pick_symbol = top_pick.symbol if top_pick else None
+        logger.info(
+            "strategist_complete n_decisions=%d top_pick=%s order_executed=%s",
+            len(decisions), top_pick_symbol, order_executed,
+            extra={
+                "n_decisions": len(decisions),
+                "top_pick": top_pick_symbol,
+                "order_executed": order_executed
+            }
+        )
         
         return output.to_dict()
 
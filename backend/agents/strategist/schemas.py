@@ -3,7 +3,7 @@ Strategist Agent Schemas
 Defines input and output contracts for the strategist agent.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
 
@@ -47,7 +47,19 @@ class TradingDecision:
     target_price: Optional[float] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'symbol': self.symbol,
+            'name': self.name,
+            'action': self.action,
+            'confidence': self.confidence,
+            'reasoning': self.reasoning,
+            'technical_score': self.technical_score,
+            'sentiment_score': self.sentiment_score,
+            'combined_score': self.combined_score,
+            'quantity': self.quantity,
+            'stop_loss': self.stop_loss,
+            'target_price': self.target_price
+        }
 
 
 @dataclass
@@ -60,6 +72,12 @@ class StrategistAgentOutput:
     execution_reason: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'decisions': self.decisions,
+            'top_pick': self.top_pick,
+            'order_executed': self.order_executed,
+            'order_details': self.order_details,
+            'execution_reason': self.execution_reason
+        }
 
 
@@ -5,11 +5,12 @@ Conforms to BaseAgent contract.
 """
 
 from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from common.base_agent import BaseAgent
+from common.base_agent import BaseAgent, raise_if_cancelled
 from .technical_schemas import TechnicalAgentInput, TechnicalAgentOutput
-from .technical_tools import analyze_stock_technical
-from agents.scouting.data_provider import StockDataProvider
+from .technical_tools import analyze_stocks_technical
+from agents.scouting.data_provider import StockDataProvider, YahooFinanceProvider
 
 logger = logging.getLogger(__name__)
 
@@ -20,17 +21,27 @@ class TechnicalAgent(BaseAgent):
     Conforms to BaseAgent contract.
     """
     
-    def __init__(self, data_provider: StockDataProvider = None):
+    def __init__(self, data_provider: StockDataProvider = None, max_fetch_workers: int = 8):
         """
         Initialize the Technical Agent.
         
         Args:
             data_provider: Optional data provider instance
+            max_fetch_workers: Number of threads used to fetch price history concurrently
         """
         super().__init__(agent_name="technical_agent")
-        # Import here to avoid circular dependency
-        from agents.scouting.data_provider import YahooFinanceProvider, StockDataProvider
         self.data_provider: StockDataProvider = data_provider or YahooFinanceProvider()
+        # Fetching is I/O-bound, so threads overlap the network waits.
+        # Indicator math stays in-process: on ~60-bar series it is far cheaper
+        # than pickling frames to a process pool.
+        self._fetch_pool = ThreadPoolExecutor(
+            max_workers=max_fetch_workers,
+            thread_name_prefix="technical-fetch"
+        )
+    
+    def close(self):
+        """Shut down the price-history fetch pool without waiting for running fetches."""
+        self._fetch_pool.shutdown(wait=False)
     
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate input data."""
@@ -69,8 +80,8 @@ class TechnicalAgent(BaseAgent):
         if len(stocks) > 0:
             logger.debug(f"Sample stock structure: {stocks[0]}")
         
-        # Analyze each stock
-        analyzed_stocks = []
+        # Collect stocks with the data needed for analysis
+        valid_stocks = []
         for stock_data in stocks:
             symbol = stock_data.get('symbol')
             name = stock_data.get('name', symbol)
@@ -80,11 +91,13 @@ class TechnicalAgent(BaseAgent):
                 logger.warning(f"Skipping stock with missing data: {stock_data}")
                 continue
             
-            logger.info(f"Analyzing {symbol}...")
-            result = analyze_stock_technical(symbol, name, current_price, self.data_provider)
-            
-            if result:
-                analyzed_stocks.append(result.to_dict())
+            valid_stocks.append((symbol, name, current_price))
+        
+        # Fetch price history concurrently, then compute indicators in batch
+        raise_if_cancelled()
+        logger.info(f"Analyzing {len(valid_stocks)} stocks...")
+        results = analyze_stocks_technical(valid_stocks, self.data_provider, executor=self._fetch_pool)
+        analyzed_stocks = [result.to_dict() for result in results if result]
         
         logger.info(f"Successfully analyzed {len(analyzed_stocks)}/{len(stocks)} stocks")
         
@@ -119,4 +132,5 @@ def create_agent(config: Dict[str, Any] = None) -> TechnicalAgent:
     """
     logger.info(f"Creating TechnicalAgent with config: {config}")
     data_provider = config.get('data_provider') if config else None
-    return TechnicalAgent(data_provider=data_provider)
\ No newline at end of file
+    max_fetch_workers = config.get('max_fetch_workers', 8) if config else 8
+    return TechnicalAgent(data_provider=data_provider, max_fetch_workers=max_fetch_workers)
\ No newline at end of file
@@ -4,52 +4,183 @@ Pure business logic functions for technical analysis.
 No side effects, stateless, and deterministic.
 """
 
+import math
 import pandas as pd
 import numpy as np
-from typing import Optional, List
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple
 import logging
 from .technical_schemas import TechnicalIndicators, TechnicalAnalysisResult
 
 logger = logging.getLogger(__name__)
 
-def calculate_rsi(prices: pd.Series, period: int = 14) -> Optional[float]:
+# Strength score contribution of each trend
+_TREND_POINTS = {'bullish': 15, 'bearish': -15}
+
+# Recommendation bands: strength < 30 -> strong_sell, ..., strength >= 70 -> strong_buy
+_RECOMMENDATION_THRESHOLDS = (30, 45, 55, 70)
+_RECOMMENDATIONS = ('strong_sell', 'sell', 'hold', 'buy', 'strong_buy')
+
+def _as_float_array(prices) -> np.ndarray:
+    """
+    Convert prices (Series, list or array) to a contiguous float64 array once,
+    so every indicator works on raw numpy without pandas dispatch.
+    
+    Args:
+        prices: Closing prices
+    
+    Returns:
+        C-contiguous float64 array
+    """
+    if isinstance(prices, pd.Series):
+        prices = prices.to_numpy(dtype=np.float64)
+    return np.ascontiguousarray(prices, dtype=np.float64)
+
+
+def _rsi_last(close_mat: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Latest RSI for every row of a (symbols x bars) price matrix.
+    Only the last `period` price changes are looked at (same simple-average
+    RSI as a rolling mean's last value).
+    
+    Args:
+        close_mat: 2-D float64 array, one row per stock
+        period: RSI period
+    
+    Returns:
+        1-D array of RSI values (NaN where undefined)
+    """
+    # Price changes over the last window only
+    delta = np.diff(close_mat[:, -(period + 1):], axis=1)
+    
+    # Average gains and losses, clipping in place of masked selects
+    avg_gain = np.maximum(delta, 0.0).mean(axis=1)
+    avg_loss = np.maximum(-delta, 0.0).mean(axis=1)
+    
+    # No losses gives RS = inf (RSI 100); a flat window gives NaN
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+
+def calculate_rsi(prices: np.ndarray, period: int = 14) -> Optional[float]:
     """
     Calculate Relative Strength Index.
     
     Args:
-        prices: Series of closing prices
+        prices: Array (or Series) of closing prices
         period: RSI period (default 14)
     
     Returns:
         RSI value (0-100) or None
     """
-    if len(prices) < period + 1:
+    values = _as_float_array(prices)
+    if len(values) < period + 1:
         return None
     
-    # Calculate price changes
-    delta = prices.diff()
+    return _last_value(_rsi_last(values[np.newaxis, :], period))
+
+
+def _ema_list(values: List[float], alpha: float) -> List[float]:
+    """
+    EMA recurrence on plain Python floats.
+    Indexing numpy scalars one at a time costs far more than the arithmetic,
+    so 1-D series are run through this loop instead.
     
-    # Separate gains and losses
-    gains = delta.where(delta > 0, 0)
-    losses = -delta.where(delta < 0, 0)
+    Args:
+        values: List of prices
+        alpha: Smoothing factor
     
-    # Calculate average gains and losses
-    avg_gain = gains.rolling(window=period).mean()
-    avg_loss = losses.rolling(window=period).mean()
+    Returns:
+        List of EMA values
+    """
+    if not values:
+        return []
+    
+    decay = 1.0 - alpha
+    ema = values[0]
+    out = [ema]
+    append = out.append
+    for value in values[1:]:
+        ema = decay * ema + alpha * value
+        append(ema)
+    return out
+
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponential moving average of a 1-D float64 array.
+    Matches pandas ewm(span=span, adjust=False).mean() without building a Series.
+    
+    Args:
+        values: 1-D array of prices
+        span: EMA span
+    
+    Returns:
+        Array of EMA values
+    """
+    alpha = 2.0 / (span + 1)
+    return np.array(_ema_list(values.tolist(), alpha), dtype=np.float64)
+
+
+@lru_cache(maxsize=32)
+def _ema_weights(span: int, n: int) -> np.ndarray:
+    """
+    Weight vector for _ema_tail, built once per (span, length).
+    Price histories share a fetch period, so only a few lengths ever occur.
+    
+    Args:
+        span: EMA span
+        n: Series length
+    
+    Returns:
+        Read-only float64 array of length n
+    """
+    alpha = 2.0 / (span + 1)
+    weights = (1 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    weights[1:] *= alpha
+    weights.flags.writeable = False
+    return weights
+
+
+def _ema_tail(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Last EMA value along the last axis, as one dot product.
+    Unrolling the adjust=False recurrence gives
+    ema[-1] = (1-a)^(n-1) * x[0] + sum_k a * (1-a)^(n-1-k) * x[k],
+    so no intermediate EMA series is built when only the tail is needed.
     
-    # Calculate RS and RSI
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
+    Args:
+        values: 1-D array of prices, or 2-D array with one row per stock
+        span: EMA span
     
-    return float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else None
+    Returns:
+        Last EMA value (scalar for 1-D input, one per row for 2-D input)
+    """
+    return values @ _ema_weights(span, values.shape[-1])
+
 
+def _optional_float(value: float) -> Optional[float]:
+    """Return value as a Python float, or None if it is NaN."""
+    value = float(value)
+    return None if math.isnan(value) else value
 
-def calculate_macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9):
+
+def _last_value(values: np.ndarray) -> Optional[float]:
+    """Return the last element as float, or None if it is NaN."""
+    return _optional_float(values[-1])
+
+
+def calculate_macd(prices: np.ndarray, fast: int = 12, slow: int = 26,
+                   signal: int = 9) -> Tuple[Optional[float], Optional[float], Optional[float]]:
     """
     Calculate MACD (Moving Average Convergence Divergence).
     
     Args:
-        prices: Series of closing prices
+        prices: Array (or Series) of closing prices
         fast: Fast EMA period
         slow: Slow EMA period
         signal: Signal line period
@@ -57,66 +188,167 @@ def calculate_macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: in
     Returns:
         Tuple of (macd_line, signal_line, histogram) or (None, None, None)
     """
-    if len(prices) < slow + signal:
+    values = _as_float_array(prices)
+    if len(values) < slow + signal:
         return None, None, None
     
-    # Calculate EMAs
-    ema_fast = prices.ewm(span=fast, adjust=False).mean()
-    ema_slow = prices.ewm(span=slow, adjust=False).mean()
-    
     # MACD line
-    macd_line = ema_fast - ema_slow
+    macd_line = _ema(values, fast) - _ema(values, slow)
     
-    # Signal line
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    # Signal line (latest value only)
+    macd = _last_value(macd_line)
+    signal_value = _optional_float(_ema_tail(macd_line, signal))
     
     # Histogram
-    histogram = macd_line - signal_line
+    if macd is None or signal_value is None:
+        return macd, signal_value, None
     
-    return (
-        float(macd_line.iloc[-1]) if not pd.isna(macd_line.iloc[-1]) else None,
-        float(signal_line.iloc[-1]) if not pd.isna(signal_line.iloc[-1]) else None,
-        float(histogram.iloc[-1]) if not pd.isna(histogram.iloc[-1]) else None
-    )
+    return macd, signal_value, macd - signal_value
 
 
-def calculate_moving_averages(prices: pd.Series):
+def calculate_moving_averages(prices: np.ndarray) -> Dict[str, Optional[float]]:
     """
     Calculate various moving averages.
     
     Args:
-        prices: Series of closing prices
+        prices: Array (or Series) of closing prices
     
     Returns:
         Dict with SMA and EMA values
     """
-    result = {}
+    values = _as_float_array(prices)
+    result: Dict[str, Optional[float]] = {}
     
-    # SMAs
-    if len(prices) >= 20:
-        result['sma_20'] = float(prices.rolling(window=20).mean().iloc[-1])
+    # SMAs (only the latest window is needed)
+    if len(values) >= 20:
+        result['sma_20'] = _optional_float(values[-20:].mean())
     else:
         result['sma_20'] = None
     
-    if len(prices) >= 50:
-        result['sma_50'] = float(prices.rolling(window=50).mean().iloc[-1])
+    if len(values) >= 50:
+        result['sma_50'] = _optional_float(values[-50:].mean())
     else:
         result['sma_50'] = None
     
-    # EMAs
-    if len(prices) >= 12:
-        result['ema_12'] = float(prices.ewm(span=12, adjust=False).mean().iloc[-1])
+    # EMAs (only the latest value is needed)
+    if len(values) >= 12:
+        result['ema_12'] = _optional_float(_ema_tail(values, 12))
     else:
         result['ema_12'] = None
     
-    if len(prices) >= 26:
-        result['ema_26'] = float(prices.ewm(span=26, adjust=False).mean().iloc[-1])
+    if len(values) >= 26:
+        result['ema_26'] = _optional_float(_ema_tail(values, 26))
     else:
         result['ema_26'] = None
     
     return result
 
 
+def _macd_line_batch(close_mat: np.ndarray, fast: int = 12, slow: int = 26) -> np.ndarray:
+    """
+    MACD line for every row of a (symbols x bars) matrix in one fused pass.
+    Both EMAs advance in the same loop over bars, and each step updates all
+    symbols with vectorized numpy ops, so no intermediate EMA series are stored.
+    
+    Args:
+        close_mat: 2-D float64 array, one row per stock
+        fast: Fast EMA period
+        slow: Slow EMA period
+    
+    Returns:
+        2-D array of MACD line values (same shape as input)
+    """
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    
+    macd_line = np.empty_like(close_mat)
+    ema_fast = close_mat[:, 0].copy()
+    ema_slow = ema_fast.copy()
+    macd_line[:, 0] = 0.0
+    for i in range(1, close_mat.shape[1]):
+        column = close_mat[:, i]
+        ema_fast *= 1 - alpha_fast
+        ema_fast += alpha_fast * column
+        ema_slow *= 1 - alpha_slow
+        ema_slow += alpha_slow * column
+        np.subtract(ema_fast, ema_slow, out=macd_line[:, i])
+    return macd_line
+
+
+def _indicator_columns(close_mat: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Compute all technical indicators for many stocks at once, column-wise.
+    Rows must share the same number of bars. Tail-only values (EMA, SMA, MACD
+    signal) are reduced directly; the MACD line is built in one fused pass over bars.
+    
+    Args:
+        close_mat: 2-D float64 array of closing prices, one row per stock
+    
+    Returns:
+        Tuple of 1-D arrays in TechnicalIndicators field order (NaN where undefined)
+    """
+    n_stocks, n_bars = close_mat.shape
+    missing = np.full(n_stocks, np.nan)
+    
+    # Latest EMA values as dot products; full series only when MACD needs them
+    ema_12 = _ema_tail(close_mat, 12) if n_bars >= 12 else missing
+    ema_26 = _ema_tail(close_mat, 26) if n_bars >= 26 else missing
+    
+    # MACD (12, 26, 9)
+    if n_bars >= 26 + 9:
+        macd_line = _macd_line_batch(close_mat)
+        macd = macd_line[:, -1]
+        macd_signal = _ema_tail(macd_line, 9)
+        macd_histogram = macd - macd_signal
+    else:
+        macd = macd_signal = macd_histogram = missing
+    
+    return (
+        _rsi_last(close_mat) if n_bars >= 14 + 1 else missing,
+        macd,
+        macd_signal,
+        macd_histogram,
+        close_mat[:, -20:].mean(axis=1) if n_bars >= 20 else missing,
+        close_mat[:, -50:].mean(axis=1) if n_bars >= 50 else missing,
+        ema_12,
+        ema_26
+    )
+
+
+def _columns_to_indicators(columns: Tuple[np.ndarray, ...]) -> List[TechnicalIndicators]:
+    """Convert indicator columns to Python floats once, NaN -> None."""
+    return [
+        TechnicalIndicators(*(None if math.isnan(value) else value for value in row))
+        for row in zip(*(column.tolist() for column in columns))
+    ]
+
+
+def compute_indicators_batch(close_mat: np.ndarray) -> List[TechnicalIndicators]:
+    """
+    Compute all technical indicators for many stocks at once.
+    
+    Args:
+        close_mat: 2-D float64 array of closing prices, one row per stock
+    
+    Returns:
+        List of TechnicalIndicators, one per row
+    """
+    return _columns_to_indicators(_indicator_columns(close_mat))
+
+
+def compute_all_indicators(close: np.ndarray) -> TechnicalIndicators:
+    """
+    Compute all technical indicators for a single stock.
+    
+    Args:
+        close: float64 array of closing prices
+    
+    Returns:
+        TechnicalIndicators
+    """
+    return compute_indicators_batch(close[np.newaxis, :])[0]
+
+
 def determine_trend(current_price: float, sma_20: Optional[float], sma_50: Optional[float]) -> str:
     """
     Determine trend based on moving averages.
@@ -143,6 +375,24 @@ def determine_trend(current_price: float, sma_20: Optional[float], sma_50: Optio
     return 'neutral'
 
 
+def determine_trend_batch(prices: np.ndarray, sma_20: np.ndarray, sma_50: np.ndarray) -> np.ndarray:
+    """
+    Determine trend for many stocks with vectorized comparisons.
+    Same rules as determine_trend; NaN SMAs compare False and give 'neutral'.
+    
+    Args:
+        prices: Current prices
+        sma_20: 20-day SMAs (NaN where unavailable)
+        sma_50: 50-day SMAs (NaN where unavailable)
+    
+    Returns:
+        Array of 'bullish', 'bearish', or 'neutral'
+    """
+    bullish = (prices > sma_20) & (sma_20 > sma_50)
+    bearish = (prices < sma_20) & (sma_20 < sma_50)
+    return np.where(bullish, 'bullish', np.where(bearish, 'bearish', 'neutral'))
+
+
 def generate_signals(rsi: Optional[float], macd: Optional[float], 
                      macd_signal: Optional[float], trend: str) -> List[str]:
     """
@@ -207,16 +457,10 @@ def calculate_strength_score(rsi: Optional[float], macd_histogram: Optional[floa
     
     # MACD contribution (±15 points)
     if macd_histogram is not None:
-        if macd_histogram > 0:
-            score += min(15, macd_histogram * 10)
-        else:
-            score -= min(15, abs(macd_histogram) * 10)
+        score += max(-15, min(15, macd_histogram * 10))
     
     # Trend contribution (±15 points)
-    if trend == 'bullish':
-        score += 15
-    elif trend == 'bearish':
-        score -= 15
+    score += _TREND_POINTS.get(trend, 0)
     
     # Clamp to 0-100
     return max(0, min(100, score))
@@ -233,16 +477,137 @@ def determine_recommendation(strength: float, trend: str) -> str:
     Returns:
         'strong_buy', 'buy', 'hold', 'sell', or 'strong_sell'
     """
-    if strength >= 70:
-        return 'strong_buy'
-    elif strength >= 55:
-        return 'buy'
-    elif strength >= 45:
-        return 'hold'
-    elif strength >= 30:
-        return 'sell'
-    else:
-        return 'strong_sell'
+    return _RECOMMENDATIONS[bisect_right(_RECOMMENDATION_THRESHOLDS, strength)]
+
+
+def fetch_price_history(symbol: str, data_provider, period: str = "3mo") -> Optional[pd.DataFrame]:
+    """
+    Fetch historical price data for a single stock.
+    This is the I/O-bound half of the analysis and is safe to run in a thread pool.
+    
+    Args:
+        symbol: Stock symbol
+        data_provider: Data provider instance
+        period: Data period (default 3 months for better indicators)
+    
+    Returns:
+        DataFrame with OHLCV data or None
+    """
+    return data_provider.fetch_historical_data(symbol, period=period)
+
+
+def _build_analysis_result(symbol: str, name: str, current_price: float,
+                           indicators: TechnicalIndicators,
+                           trend: Optional[str] = None) -> TechnicalAnalysisResult:
+    """Derive trend (unless precomputed), signals, strength and recommendation from indicators."""
+    # Determine trend
+    if trend is None:
+        trend = determine_trend(current_price, indicators.sma_20, indicators.sma_50)
+    
+    # Generate signals
+    signals = generate_signals(indicators.rsi, indicators.macd, indicators.macd_signal, trend)
+    
+    # Calculate strength
+    strength = calculate_strength_score(indicators.rsi, indicators.macd_histogram, trend)
+    
+    # Determine recommendation
+    recommendation = determine_recommendation(strength, trend)
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("✓ %s: Analyzed - %s, Strength: %.1f, %s",
+                    symbol, trend.upper(), strength, recommendation.upper())
+    
+    return TechnicalAnalysisResult(
+        symbol=symbol,
+        name=name,
+        current_price=current_price,
+        indicators=indicators,
+        trend=trend,
+        strength=strength,
+        signals=signals,
+        recommendation=recommendation
+    )
+
+
+def compute_technical_analysis(symbol: str, name: str, current_price: float,
+                               data: Optional[pd.DataFrame]) -> Optional[TechnicalAnalysisResult]:
+    """
+    Compute indicators, trend and recommendation from already fetched price data.
+    Pure CPU work - no I/O.
+    
+    Args:
+        symbol: Stock symbol
+        name: Stock name
+        current_price: Current price
+        data: Historical price data with a 'Close' column
+    
+    Returns:
+        TechnicalAnalysisResult or None
+    """
+    try:
+        if data is None or len(data) < 50:
+            logger.warning("Insufficient data for %s", symbol)
+            return None
+        
+        indicators = compute_all_indicators(_as_float_array(data['Close']))
+        return _build_analysis_result(symbol, name, current_price, indicators)
+    except Exception as e:
+        logger.error("Error analyzing %s: %s", symbol, e)
+        return None
+
+
+def compute_technical_analysis_batch(
+    stocks: List[Tuple[str, str, float]],
+    price_data: List[Optional[pd.DataFrame]]
+) -> List[Optional[TechnicalAnalysisResult]]:
+    """
+    Compute technical analysis for many stocks with one vectorized pass per
+    history length. Histories of equal length (the normal case for a shared
+    period) are stacked into a (symbols x bars) matrix. Histories are not
+    truncated to a common length, because EMA values depend on the full series.
+    
+    Args:
+        stocks: List of (symbol, name, current_price) tuples
+        price_data: Historical price data for each stock (same order)
+    
+    Returns:
+        List of TechnicalAnalysisResult (None where analysis failed), same order as input
+    """
+    results: List[Optional[TechnicalAnalysisResult]] = [None] * len(stocks)
+    
+    # Group stock indices by history length
+    groups: Dict[int, List[int]] = defaultdict(list)
+    closes: Dict[int, np.ndarray] = {}
+    for idx, ((symbol, _, _), data) in enumerate(zip(stocks, price_data)):
+        try:
+            if data is None or len(data) < 50:
+                logger.warning("Insufficient data for %s", symbol)
+                continue
+            closes[idx] = _as_float_array(data['Close'])
+            groups[len(closes[idx])].append(idx)
+        except Exception as e:
+            logger.error("Error analyzing %s: %s", symbol, e)
+    
+    for indices in groups.values():
+        try:
+            close_mat = np.vstack([closes[idx] for idx in indices])
+            columns = _indicator_columns(close_mat)
+            prices = np.array([stocks[idx][2] for idx in indices], dtype=np.float64)
+            trends = determine_trend_batch(prices, columns[4], columns[5]).tolist()
+            batch_indicators = _columns_to_indicators(columns)
+        except Exception as e:
+            for idx in indices:
+                logger.error("Error analyzing %s: %s", stocks[idx][0], e)
+            continue
+        
+        for idx, indicators, trend in zip(indices, batch_indicators, trends):
+            symbol, name, current_price = stocks[idx]
+            try:
+                results[idx] = _build_analysis_result(symbol, name, current_price, indicators, trend)
+            except Exception as e:
+                logger.error("Error analyzing %s: %s", symbol, e)
+    
+    return results
 
 
 def analyze_stock_technical(symbol: str, name: str, current_price: float, 
@@ -261,55 +626,43 @@ def analyze_stock_technical(symbol: str, name: str, current_price: float,
     """
     try:
         # Fetch historical data (3 months for better indicators)
-        data = data_provider.fetch_historical_data(symbol, period="3mo")
-        
-        if data is None or len(data) < 50:
-            logger.warning(f"Insufficient data for {symbol}")
+        data = fetch_price_history(symbol, data_provider)
+    except Exception as e:
+        logger.error("Error analyzing %s: %s", symbol, e)
+        return None
+    
+    return compute_technical_analysis(symbol, name, current_price, data)
+
+
+def analyze_stocks_technical(
+    stocks: List[Tuple[str, str, float]],
+    data_provider,
+    executor: Optional[Executor] = None
+) -> List[Optional[TechnicalAnalysisResult]]:
+    """
+    Perform technical analysis on many stocks.
+    All price histories are fetched up front (concurrently if an executor is
+    given), then indicators are computed in batch.
+    
+    Args:
+        stocks: List of (symbol, name, current_price) tuples
+        data_provider: Data provider instance
+        executor: Optional executor used for the I/O-bound fetches
+    
+    Returns:
+        List of TechnicalAnalysisResult (None where analysis failed), same order as input
+    """
+    def fetch(symbol: str) -> Optional[pd.DataFrame]:
+        try:
+            return fetch_price_history(symbol, data_provider)
+        except Exception as e:
+            logger.error("Error analyzing %s: %s", symbol, e)
             return None
-        
-        prices = data['Close']
-        
-        # Calculate indicators
-        rsi = calculate_rsi(prices)
-        macd, macd_signal, macd_histogram = calculate_macd(prices)
-        mas = calculate_moving_averages(prices)
-        
-        indicators = TechnicalIndicators(
-            rsi=rsi,
-            macd=macd,
-            macd_signal=macd_signal,
-            macd_histogram=macd_histogram,
-            sma_20=mas.get('sma_20'),
-            sma_50=mas.get('sma_50'),
-            ema_12=mas.get('ema_12'),
-            ema_26=mas.get('ema_26')
-        )
-        
-        # Determine trend
-        trend = determine_trend(current_price, mas.get('sma_20'), mas.get('sma_50'))
-        
-        # Generate signals
-        signals = generate_signals(rsi, macd, macd_signal, trend)
-        
-        # Calculate strength
-        strength = calculate_strength_score(rsi, macd_histogram, trend)
-        
-        # Determine recommendation
-        recommendation = determine_recommendation(strength, trend)
-        
-        logger.info(f"✓ {symbol}: Analyzed - {trend.upper()}, Strength: {strength:.1f}, {recommendation.upper()}")
-        
-        return TechnicalAnalysisResult(
-            symbol=symbol,
-            name=name,
-            current_price=current_price,
-            indicators=indicators,
-            trend=trend,
-            strength=strength,
-            signals=signals,
-            recommendation=recommendation
-        )
     
-    except Exception as e:
-        logger.error(f"Error analyzing {symbol}: {e}")
-        return None
\ No newline at end of file
+    symbols = [symbol for symbol, _, _ in stocks]
+    if executor is not None:
+        price_data = list(executor.map(fetch, symbols))
+    else:
+        price_data = [fetch(symbol) for symbol in symbols]
+    
+    return compute_technical_analysis_batch(stocks, price_data)
@@ -5,8 +5,31 @@ Agents should be stateless, deterministic, and have no side effects.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from contextvars import ContextVar
+from typing import Dict, Any, Optional
 from datetime import datetime
+import threading
+
+
+class AgentCancelledError(Exception):
+    """Raised inside an agent's run when its execution has been cancelled."""
+
+
+# Cancel token of the agent execution running in the current context
+_cancel_token: ContextVar[Optional[threading.Event]] = ContextVar('agent_cancel_token', default=None)
+
+
+def raise_if_cancelled():
+    """
+    Check the cancel token of the current agent execution.
+    Agents call this inside long loops so they stop early once a sibling failed.
+    
+    Raises:
+        AgentCancelledError: If the execution has been cancelled
+    """
+    token = _cancel_token.get()
+    if token is not None and token.is_set():
+        raise AgentCancelledError("Agent execution cancelled")
 
 
 class BaseAgent(ABC):
@@ -53,44 +76,61 @@ class BaseAgent(ABC):
         """
         pass
     
-    def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    def execute(self, input_data: Dict[str, Any],
+                cancel_token: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         Public execution method with validation and error handling.
         
         Args:
             input_data: Input data dictionary
+            cancel_token: Optional event; once set, raise_if_cancelled() aborts the run
         
         Returns:
             Dict with 'status', 'data', 'error', 'timestamp' keys
         """
+        token = _cancel_token.set(cancel_token)
         try:
             # Validate input
             if not self.validate_input(input_data):
-                return {
-                    'agent': self.agent_name,
-                    'status': 'error',
-                    'timestamp': datetime.now().isoformat(),
-                    'error': 'Invalid input data',
-                    'data': None
-                }
+                return self._result('error', error='Invalid input data')
             
             # Execute agent logic
             output_data = self.run(input_data)
             
             # Return standardized format
-            return {
-                'agent': self.agent_name,
-                'status': 'success',
-                'timestamp': datetime.now().isoformat(),
-                'data': output_data,
-                'error': None
-            }
+            return self._result('success', data=output_data)
             
+        except AgentCancelledError as e:
+            return self._result('cancelled', error=str(e))
         except Exception as e:
-            return {
-                'agent': self.agent_name,
-                'status': 'error',
-                'timestamp': datetime.now().isoformat(),
-                'error': str(e),
-                'data': None
-            }
+            return self._result('error', error=str(e))
+        finally:
+            _cancel_token.reset(token)
+    
+    def close(self):
+        """
+        Release resources held by the agent (thread pools, connections).
+        Called when a cached agent is evicted; the default holds nothing.
+        """
+        pass
+    
+    def _result(self, status: str, data: Any = None, error: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the standardized execution envelope.
+        The timestamp is taken once, when the envelope is built.
+        
+        Args:
+            status: 'success', 'error' or 'cancelled'
+            data: Agent output data
+            error: Error message, if any
+        
+        Returns:
+            Dict with 'agent', 'status', 'timestamp', 'data', 'error' keys
+        """
+        return {
+            'agent': self.agent_name,
+            'status': status,
+            'timestamp': datetime.now().isoformat(),
+            'data': data,
+            'error': error
+        }
@@ -3,20 +3,43 @@ Simple Caching Utility
 Provides caching with 3-hour TTL for agent results.
 """
 
-from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Spaces are dropped and dots become underscores in one pass over the key
+_KEY_TRANSLATION = str.maketrans({" ": None, ".": "_"})
+
 
 class Cache:
-    """Simple in-memory cache with 3-hour TTL."""
+    """
+    Simple in-memory cache with 3-hour TTL.
+    
+    Expiry is tracked as absolute seconds on a monotonic clock, so wall-clock
+    adjustments never expire or resurrect entries. One instance is shared by
+    agents running on worker threads, so reads and writes hold a lock.
+    """
     
-    def __init__(self):
-        """Initialize cache."""
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, max_entries: int = 1024, time_fn: Callable[[], float] = time.monotonic):
+        """
+        Initialize cache.
+        
+        Args:
+            max_entries: Maximum number of entries kept; least recently used are evicted first
+            time_fn: Clock returning seconds, used for TTL expiry (injectable for tests)
+        """
+        # key -> (value, expiry on the time_fn clock)
+        self._cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
         self.ttl_hours = 3.0
+        self.ttl_seconds = self.ttl_hours * 3600
+        self.max_entries = max_entries
+        self._time_fn = time_fn
+        # get() also mutates (expiry, LRU order), so both paths take the lock
+        self._lock = threading.Lock()
     
     def generate_key(self, prefix: str, **kwargs) -> str:
         """
@@ -24,33 +47,33 @@ class Cache:
         
         Example: generate_key('scouting', top_n=5) -> 'scouting_top_n_5'
         """
-        key_parts = [prefix]
-        for key, value in sorted(kwargs.items()):
-            key_parts.append(f"{key}_{value}")
-        return "_".join(key_parts).replace(" ", "").replace(".", "_")
+        key = "_".join([prefix] + [f"{name}_{value}" for name, value in sorted(kwargs.items())])
+        return key.translate(_KEY_TRANSLATION)
     
     def get(self, key: str) -> Optional[Any]:
         """Get cached value if not expired (3 hours)."""
-        if key not in self._cache:
-            return None
-        
-        entry = self._cache[key]
-        age = datetime.now() - entry['timestamp']
-        
-        if age > timedelta(hours=self.ttl_hours):
-            del self._cache[key]
-            return None
-        
-        logger.debug(f"Cache hit: {key}")
-        return entry['data']
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            
+            value, expiry = entry
+            if self._time_fn() > expiry:
+                del self._cache[key]
+                return None
+            
+            self._cache.move_to_end(key)
+        logger.debug("Cache hit: %s", key)
+        return value
     
     def set(self, key: str, value: Any):
         """Store value in cache."""
-        self._cache[key] = {
-            'data': value,
-            'timestamp': datetime.now()
-        }
-        logger.debug(f"Cache set: {key}")
+        with self._lock:
+            self._cache[key] = (value, self._time_fn() + self.ttl_seconds)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        logger.debug("Cache set: %s", key)
 
 
 # Global cache instance
@@ -0,0 +1,10 @@
+"""
+Python Version Compatibility
+Helpers for features that depend on the running Python version.
+"""
+
+import sys
+
+# Keyword arguments enabling __slots__ on dataclasses where supported (Python 3.10+).
+# Usage: @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -5,23 +5,64 @@ Starts the FastAPI server and provides endpoints to trigger DAG execution.
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from typing import Deque, Dict, Any, Optional, Tuple, Union
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+import json
+import orjson
 import uvicorn
 import logging
+import threading
 from orchestrator.main import create_orchestrator
+from orchestrator.schemas import OrchestrationResult
 from common.logging_config import setup_logging
 
 # Setup logging
 setup_logging(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    Serialize values orjson has no native support for.
+    Agent data comes from numpy/pandas math, so stray scalar types
+    (e.g. numpy.longdouble, pandas.Timedelta) must not turn a response into a 500.
+    
+    Args:
+        obj: Value orjson could not serialize
+    
+    Returns:
+        JSON-serializable replacement
+    """
+    # numpy scalars
+    if hasattr(obj, 'item'):
+        return obj.item()
+    # date/time-like values
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class AgentDataJSONResponse(ORJSONResponse):
+    """ORJSONResponse for raw agent data: numpy arrays/scalars and a fallback for other types."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Swing Trader API",
     description="Multi-Agent Trading System Backend",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=AgentDataJSONResponse
 )
 
 # CORS middleware
@@ -37,7 +78,11 @@ app.add_middleware(
 logger.info("Initializing backend...")
 orchestrator = create_orchestrator()
 logger.info("Orchestrator initialized successfully")
-execution_history: list[Dict[str, Any]] = []
+# Keep only the last 100 executions; the deque evicts the oldest on append
+execution_history: Deque[Dict[str, Any]] = deque(maxlen=100)
+# Writers hold the lock; readers use the immutable snapshot published after each write
+_history_lock = threading.Lock()
+_history_snapshot: Tuple[Dict[str, Any], ...] = ()
 
 
 class ExecutionRequest(BaseModel):
@@ -59,27 +104,42 @@ def _generate_execution_id() -> str:
     return f"exec_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
 
 
-def _store_execution(execution_id: str, result: Dict[str, Any], status: str = "completed", error: Optional[str] = None):
-    """Store execution result in history."""
-    execution_history.append({
+def _store_execution(execution_id: str, result: Union[OrchestrationResult, Dict[str, Any]],
+                     status: str = "completed", error: Optional[str] = None):
+    """
+    Store execution result in history.
+    The OrchestrationResult is kept as-is; orjson serializes the dataclass
+    tree directly when the history is served.
+    """
+    global _history_snapshot
+    record = {
         "execution_id": execution_id,
         "result": result,
         "timestamp": datetime.now().isoformat(),
         "status": status,
         "error": error
-    })
-    # Keep only last 100 executions
-    if len(execution_history) > 100:
-        execution_history.pop(0)
+    }
+    with _history_lock:
+        execution_history.append(record)
+        _history_snapshot = tuple(execution_history)
+
+
+@lru_cache(maxsize=16)
+def _orchestrator_for(dag_config_json: str):
+    """Build (once) the orchestrator for a canonical JSON-encoded DAG config."""
+    return create_orchestrator(dag_config=json.loads(dag_config_json))
 
 
-def _execute_dag(request: ExecutionRequest) -> Dict[str, Any]:
+def _execute_dag(request: ExecutionRequest) -> OrchestrationResult:
     """Execute DAG and return result."""
     logger.info("Executing DAG workflow...")
-    exec_orchestrator = create_orchestrator(dag_config=request.dag_config) if request.dag_config else orchestrator
+    if request.dag_config:
+        exec_orchestrator = _orchestrator_for(json.dumps(request.dag_config, sort_keys=True))
+    else:
+        exec_orchestrator = orchestrator
     result = exec_orchestrator.execute(initial_input=request.initial_input)
     logger.info(f"DAG execution completed with status: {result.status}")
-    return result.to_dict()
+    return result
 
 
 @app.get("/")
@@ -121,15 +181,15 @@ async def get_dag_info():
 #     logger.info(f"Received DAG execution request. Execution ID: {execution_id}")
     
 #     try:
-#         result_dict = _execute_dag(request)
-#         _store_execution(execution_id, result_dict)
+#         result = _execute_dag(request)
+#         _store_execution(execution_id, result)
 #         logger.info(f"DAG execution {execution_id} stored successfully")
         
 #         return ExecutionResponse(
 #             execution_id=execution_id,
-#             status=result_dict.get("status", "success"),
+#             status=result.status,
 #             message="DAG execution completed",
-#             timestamp=result_dict.get("timestamp", datetime.now().isoformat())
+#             timestamp=result.timestamp
 #         )
 #     except Exception as e:
 #         logger.error(f"DAG execution {execution_id} failed: {str(e)}", exc_info=True)
@@ -144,8 +204,8 @@ async def get_dag_info():
     
 #     def run_dag():
 #         try:
-#             result_dict = _execute_dag(request)
-#             _store_execution(execution_id, result_dict)
+#             result = _execute_dag(request)
+#             _store_execution(execution_id, result)
 #         except Exception as e:
 #             _store_execution(execution_id, {}, status="failed", error=str(e))
     
@@ -162,18 +222,21 @@ async def get_dag_info():
 @app.get("/executions")
 async def get_executions(limit: int = 10):
     """Get execution history."""
-    return {
-        "total": len(execution_history),
-        "executions": execution_history[-limit:]
-    }
+    snapshot = _history_snapshot
+    # Returned as a response directly so orjson walks the stored dataclasses
+    # instead of FastAPI's jsonable_encoder building intermediate dicts
+    return AgentDataJSONResponse({
+        "total": len(snapshot),
+        "executions": snapshot[-limit:]
+    })
 
 
 @app.get("/executions/{execution_id}")
 async def get_execution(execution_id: str):
     """Get specific execution result."""
-    for record in execution_history:
+    for record in _history_snapshot:
         if record["execution_id"] == execution_id:
-            return record
+            return AgentDataJSONResponse(record)
     raise HTTPException(status_code=404, detail="Execution not found")
 
 
@@ -216,4 +279,6 @@ if __name__ == "__main__":
     logger.info("Starting FastAPI server...")
     logger.info("Server will be available at http://0.0.0.0:8000")
     logger.info("API docs available at http://localhost:8000/docs")
-    # uvicorn.run("main:app", host="0.0.0.0", port=8000, log_level="info")
+    # Single worker: execution history and the startup DAG run live in this process
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, log_level="info",
+                loop="uvloop", http="httptools")
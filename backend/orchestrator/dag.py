@@ -6,9 +6,14 @@ No business logic - only DAG structure and ordering.
 
 from typing import Dict, List, Set, Optional
 from collections import defaultdict, deque
+from functools import lru_cache
 from .schemas import DAGConfig, AgentNode
 
 
+class DAGValidationError(ValueError):
+    """Raised when a DAG configuration is structurally invalid."""
+
+
 # Declarative DAG Configuration
 # This is the ONLY place where agent order is defined
 # Follows typical trading workflow:
@@ -106,12 +111,63 @@ def load_dag_config(config: Dict) -> DAGConfig:
         DAGConfig object
     """
     nodes = [AgentNode(**node) for node in config['nodes']]
-    return DAGConfig(
+    dag_config = DAGConfig(
         name=config['name'],
         description=config['description'],
         nodes=nodes,
         edges=config['edges']
     )
+    validate_dag(dag_config)
+    return dag_config
+
+
+def validate_dag(dag_config: DAGConfig):
+    """
+    Validate DAG structure before any agent runs.
+    
+    Args:
+        dag_config: DAG configuration
+    
+    Raises:
+        DAGValidationError: If an edge or input mapping references an unknown agent,
+            an input mapping source is not an upstream edge, there is no root node,
+            the DAG has a cycle, or a node would never be executed
+    """
+    node_ids = {node.agent_id for node in dag_config.nodes}
+    edge_set = set()
+    
+    # (1) Every edge endpoint is a known node
+    for edge in dag_config.edges:
+        for endpoint in (edge['from'], edge['to']):
+            if endpoint not in node_ids:
+                raise DAGValidationError(f"Edge {edge['from']} -> {edge['to']} references unknown agent '{endpoint}'")
+        edge_set.add((edge['from'], edge['to']))
+    
+    # (2) Every input mapping source is a known node with an edge to the consumer
+    for node in dag_config.nodes:
+        for _, source_agent_id, _ in node.parsed_inputs:
+            if source_agent_id not in node_ids:
+                raise DAGValidationError(f"Agent '{node.agent_id}' maps input from unknown agent '{source_agent_id}'")
+            if (source_agent_id, node.agent_id) not in edge_set:
+                raise DAGValidationError(
+                    f"Agent '{node.agent_id}' maps input from '{source_agent_id}' without an edge {source_agent_id} -> {node.agent_id}"
+                )
+    
+    # (3) At least one root node
+    targets = {to_node for _, to_node in edge_set}
+    if node_ids and not node_ids - targets:
+        raise DAGValidationError("DAG has no root node (every agent has a dependency)")
+    
+    # (4) Acyclic, and the resolved order covers every node
+    try:
+        execution_order = resolve_execution_order(dag_config.edges)
+    except ValueError as e:
+        raise DAGValidationError(str(e)) from e
+    
+    ordered = {agent_id for level in execution_order for agent_id in level}
+    unreachable = node_ids - ordered
+    if unreachable:
+        raise DAGValidationError(f"Agents never executed (not connected by any edge): {sorted(unreachable)}")
 
 
 def build_dependency_graph(edges: List[Dict[str, str]]) -> Dict[str, Set[str]]:
@@ -125,23 +181,19 @@ def build_dependency_graph(edges: List[Dict[str, str]]) -> Dict[str, Set[str]]:
         Dict mapping agent_id to set of dependent agent_ids
     """
     graph = defaultdict(set)
-    in_degree = defaultdict(int)
+    in_degree = {}
     node_ids = set()
     
-    # Collect all node IDs
-    for edge in edges:
-        node_ids.add(edge['from'])
-        node_ids.add(edge['to'])
-    
-    # Build graph and calculate in-degrees
+    # Collect node IDs, build graph and calculate in-degrees in one pass
     for edge in edges:
         from_node = edge['from']
         to_node = edge['to']
-        graph[from_node].add(to_node)
-        in_degree[to_node] += 1
-        # Initialize in-degree for all nodes
-        if from_node not in in_degree:
-            in_degree[from_node] = 0
+        node_ids.add(from_node)
+        node_ids.add(to_node)
+        if to_node not in graph[from_node]:
+            graph[from_node].add(to_node)
+            in_degree[to_node] = in_degree.get(to_node, 0) + 1
+        in_degree.setdefault(from_node, 0)
     
     return graph, in_degree, node_ids
 
@@ -162,7 +214,7 @@ def resolve_execution_order(edges: List[Dict[str, str]]) -> List[List[str]]:
     # Find root nodes (nodes with no dependencies)
     queue = deque([node for node in node_ids if in_degree[node] == 0])
     execution_order = []
-    remaining_in_degree = in_degree.copy()
+    processed = 0
     
     while queue:
         # Current level (can run in parallel)
@@ -173,25 +225,27 @@ def resolve_execution_order(edges: List[Dict[str, str]]) -> List[List[str]]:
             node = queue.popleft()
             current_level.append(node)
             
-            # Process dependents
+            # Process dependents (in_degree is local to this call, so mutate it directly)
             for dependent in graph[node]:
-                remaining_in_degree[dependent] -= 1
-                if remaining_in_degree[dependent] == 0:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
                     queue.append(dependent)
         
-        if current_level:
-            execution_order.append(current_level)
+        processed += len(current_level)
+        execution_order.append(current_level)
     
-    # Check for cycles
-    if sum(remaining_in_degree.values()) > 0:
+    # Nodes left unprocessed are part of (or downstream of) a cycle
+    if processed != len(node_ids):
         raise ValueError("DAG contains cycles - cannot resolve execution order")
     
     return execution_order
 
 
+@lru_cache(maxsize=1)
 def get_dag_config() -> DAGConfig:
     """
     Get the default trading DAG configuration.
+    TRADING_DAG_CONFIG is static, so the DAGConfig is built once and shared.
     
     Returns:
         DAGConfig object
@@ -199,6 +253,10 @@ def get_dag_config() -> DAGConfig:
     return load_dag_config(TRADING_DAG_CONFIG)
 
 
+# Execution order of the default DAG, resolved once at import
+_DEFAULT_EXECUTION_ORDER = tuple(tuple(level) for level in resolve_execution_order(TRADING_DAG_CONFIG['edges']))
+
+
 def get_execution_order(dag_config: Optional[DAGConfig] = None) -> List[List[str]]:
     """
     Get execution order for the DAG.
@@ -209,8 +267,8 @@ def get_execution_order(dag_config: Optional[DAGConfig] = None) -> List[List[str
     Returns:
         List of execution levels
     """
-    if dag_config is None:
-        dag_config = get_dag_config()
+    if dag_config is None or dag_config is get_dag_config():
+        return [list(level) for level in _DEFAULT_EXECUTION_ORDER]
     
     return resolve_execution_order(dag_config.edges)
 
@@ -226,10 +284,7 @@ def get_node_by_id(dag_config: DAGConfig, agent_id: str) -> Optional[AgentNode]:
     Returns:
         AgentNode if found, None otherwise
     """
-    for node in dag_config.nodes:
-        if node.agent_id == agent_id:
-            return node
-    return None
+    return dag_config._node_index.get(agent_id)
 
 
 def get_dependencies(dag_config: DAGConfig, agent_id: str) -> List[str]:
@@ -243,11 +298,7 @@ def get_dependencies(dag_config: DAGConfig, agent_id: str) -> List[str]:
     Returns:
         List of dependency agent IDs
     """
-    dependencies = []
-    for edge in dag_config.edges:
-        if edge['to'] == agent_id:
-            dependencies.append(edge['from'])
-    return dependencies
+    return list(dag_config._deps.get(agent_id, ()))
 
 
 def get_dependents(dag_config: DAGConfig, agent_id: str) -> List[str]:
@@ -261,8 +312,4 @@ def get_dependents(dag_config: DAGConfig, agent_id: str) -> List[str]:
     Returns:
         List of dependent agent IDs
     """
-    dependents = []
-    for edge in dag_config.edges:
-        if edge['from'] == agent_id:
-            dependents.append(edge['to'])
-    return dependents
+    return list(dag_config._dependents.get(agent_id, ()))
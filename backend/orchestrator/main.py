@@ -6,16 +6,42 @@ Orchestrator has ONLY 3 responsibilities:
 
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from datetime import datetime
 import importlib
+import json
 import logging
+import threading
 from .dag import get_dag_config, get_execution_order, get_node_by_id, get_dependencies
-from .schemas import AgentExecutionResult, OrchestrationResult
+from .schemas import AgentExecutionResult, AgentNode, OrchestrationResult
 from common.base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+# Process-wide agent instances keyed by (module, class, canonical config), so
+# orchestrators created per request reuse already constructed agents
+_AGENT_CACHE: Dict[Tuple[str, str, str], BaseAgent] = {}
+_AGENT_CACHE_LOCK = threading.Lock()
+
+
+def _agent_cache_key(node: AgentNode) -> Tuple[str, str, str]:
+    """Build the agent cache key for a node (config serialized with sorted keys)."""
+    return (node.agent_module, node.agent_class, json.dumps(node.config, sort_keys=True, default=repr))
+
+
+def clear_agent_cache():
+    """Drop all process-wide cached agent instances and release their resources."""
+    with _AGENT_CACHE_LOCK:
+        agents = list(_AGENT_CACHE.values())
+        _AGENT_CACHE.clear()
+    
+    for agent in agents:
+        try:
+            agent.close()
+        except Exception as e:
+            logger.warning(f"Error closing agent {agent.agent_name}: {e}")
+
 
 class Orchestrator:
     """
@@ -42,30 +68,101 @@ class Orchestrator:
         
         self.execution_order = get_execution_order(self.dag_config)
         logger.info(f"Resolved execution order: {self.execution_order}")
-        self.execution_results: Dict[str, AgentExecutionResult] = {}
         self.agent_instances: Dict[str, BaseAgent] = {}
+        # Agents of one level load concurrently; guards the agent_instances check-then-set
+        self._agent_lock = threading.Lock()
+        # Per-agent callbacks run after the agent executes (e.g. result reporting)
+        self._post_hooks: Dict[str, Callable[[AgentExecutionResult], None]] = {}
         logger.info("Orchestrator initialized successfully")
     
-    def _load_agent(self, agent_id: str) -> BaseAgent:
+    def register_post_hook(self, agent_id: str, hook: Callable[[AgentExecutionResult], None]):
         """
-        Dynamically load and instantiate an agent.
+        Register a callback invoked with an agent's result after it executes.
+        Agent modules can also expose a module-level `post_execution_hook`,
+        which is registered automatically when the agent is loaded.
         
         Args:
             agent_id: Agent ID
+            hook: Callable taking the AgentExecutionResult
+        """
+        self._post_hooks[agent_id] = hook
+    
+    def _load_agent(self, node: AgentNode) -> BaseAgent:
+        """
+        Dynamically load and instantiate an agent.
+        
+        Args:
+            node: Agent node (already resolved by the caller)
         
         Returns:
             BaseAgent instance
         """
-        if agent_id in self.agent_instances:
-            logger.debug(f"Agent {agent_id} already loaded, returning cached instance")
-            return self.agent_instances[agent_id]
+        agent_id = node.agent_id
+        key = _agent_cache_key(node)
+        with self._agent_lock:
+            agent = self.agent_instances.get(agent_id)
+            if agent is not None:
+                logger.debug(f"Agent {agent_id} already loaded, returning cached instance")
+                return agent
+            with _AGENT_CACHE_LOCK:
+                agent = _AGENT_CACHE.get(key)
         
-        logger.info(f"Loading agent: {agent_id}")
+        built = None
+        if agent is None:
+            # Construct outside the locks so slow agent setup doesn't serialize a level;
+            # if another thread got there first, its instance wins
+            agent = built = self._instantiate_agent(node)
+        else:
+            logger.debug(f"Reusing process-wide instance for agent {agent_id}")
+        
+        # Pick up the agent module's result hook unless one was registered explicitly.
+        # Resolved before taking the locks, since an import under them would
+        # serialize every agent load
+        hook = None
+        if agent_id not in self._post_hooks:
+            hook = getattr(importlib.import_module(node.agent_module), 'post_execution_hook', None)
+        
+        with self._agent_lock:
+            with _AGENT_CACHE_LOCK:
+                agent = _AGENT_CACHE.setdefault(key, agent)
+            agent = self.agent_instances.setdefault(agent_id, agent)
+            if callable(hook):
+                self._post_hooks.setdefault(agent_id, hook)
+        
+        # Release the resources of an instance that lost the race
+        if built is not None and built is not agent:
+            built.close()
+        return agent
+    
+    def _get_node(self, agent_id: str) -> AgentNode:
+        """
+        Resolve an agent's node once per execution.
+        
+        Args:
+            agent_id: Agent ID
+        
+        Returns:
+            AgentNode
+        """
         node = get_node_by_id(self.dag_config, agent_id)
         if not node:
             logger.error(f"Agent node not found: {agent_id}")
             raise ValueError(f"Agent node not found: {agent_id}")
-                
+        return node
+    
+    def _instantiate_agent(self, node: AgentNode) -> BaseAgent:
+        """
+        Import an agent's module and instantiate it from its node config.
+        
+        Args:
+            node: Agent node
+        
+        Returns:
+            BaseAgent instance
+        """
+        agent_id = node.agent_id
+        logger.info(f"Loading agent: {agent_id}")
+        
         # Dynamically import agent module
         try:
             module = importlib.import_module(node.agent_module)
@@ -92,34 +189,32 @@ class Orchestrator:
             logger.error(f"Failed to instantiate agent {agent_id}: {str(e)}")
             raise
         
-        self.agent_instances[agent_id] = agent
         return agent
     
-    def _prepare_input(self, agent_id: str, execution_results: Dict[str, AgentExecutionResult]) -> Dict[str, Any]:
+    def _prepare_input(self, node: AgentNode, execution_results: Dict[str, AgentExecutionResult]) -> Dict[str, Any]:
         """
         Prepare input for an agent based on its input_mapping and execution results.
         
         Args:
-            agent_id: Agent ID
+            node: Agent node
             execution_results: Dictionary of execution results
         
         Returns:
             Input dictionary for the agent
         """
-        logger.debug(f"Preparing input for agent: {agent_id}")
-        node = get_node_by_id(self.dag_config, agent_id)
-        if not node or not node.input_mapping:
-            logger.debug(f"Agent {agent_id} is root node or has no input mapping, returning empty input")
+        agent_id = node.agent_id
+        logger.debug("Preparing input for agent: %s", agent_id)
+        if not node.input_mapping:
+            logger.debug("Agent %s is root node or has no input mapping, returning empty input", agent_id)
             return {}  # Root node or no input mapping
         
         input_data = {}
-        logger.debug(f"Input mapping for {agent_id}: {node.input_mapping}")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("Input mapping for %s: %s", agent_id, node.input_mapping)
         
-        for input_key, source_path in node.input_mapping.items():
-            # Parse source path: "parent_agent.data_key" or "parent_agent"
-            parts = source_path.split('.', 1)
-            source_agent_id = parts[0]
-            
+        # Source paths were parsed once when the DAG was loaded
+        for input_key, source_agent_id, data_key in node.parsed_inputs:
             if source_agent_id not in execution_results:
                 raise ValueError(f"Source agent '{source_agent_id}' not found in execution results")
             
@@ -128,35 +223,43 @@ class Orchestrator:
             if source_result.status != 'success':
                 raise ValueError(f"Source agent '{source_agent_id}' failed: {source_result.error}")
             
-            if len(parts) == 2:
+            if data_key is not None:
                 # Navigate nested data path
-                data_key = parts[1]
                 source_data = source_result.data
-                logger.debug(f"Looking for key '{data_key}' in source agent '{source_agent_id}' data")
-                logger.debug(f"Available keys in source data: {list(source_data.keys()) if source_data else 'None'}")
+                if debug_enabled:
+                    logger.debug("Looking for key '%s' in source agent '%s' data", data_key, source_agent_id)
+                    logger.debug("Available keys in source data: %s", list(source_data.keys()) if source_data else 'None')
                 
                 # Simple path navigation (can be extended for nested paths)
                 if data_key in source_data:
-                    input_data[input_key] = source_data[data_key]
-                    logger.debug(f"Mapped {source_agent_id}.{data_key} -> {input_key} (type: {type(source_data[data_key])}, length: {len(source_data[data_key]) if isinstance(source_data[data_key], (list, dict)) else 'N/A'})")
+                    value = source_data[data_key]
+                    input_data[input_key] = value
+                    if debug_enabled:
+                        logger.debug("Mapped %s.%s -> %s (type: %s, length: %s)",
+                                     source_agent_id, data_key, input_key, type(value),
+                                     len(value) if isinstance(value, (list, dict)) else 'N/A')
                 else:
                     # Try to get from nested structure
-                    logger.warning(f"Key '{data_key}' not found in source data, using entire data structure")
+                    logger.warning("Key '%s' not found in source data, using entire data structure", data_key)
                     input_data[input_key] = source_data
             else:
                 # Use entire data
-                logger.debug(f"Using entire data from {source_agent_id} for {input_key}")
+                logger.debug("Using entire data from %s for %s", source_agent_id, input_key)
                 input_data[input_key] = source_result.data
         
         return input_data
     
-    def execute_agent(self, agent_id: str, input_data: Dict[str, Any]) -> AgentExecutionResult:
+    def execute_agent(self, agent_id: str, input_data: Dict[str, Any],
+                      cancel_token: Optional[threading.Event] = None,
+                      node: Optional[AgentNode] = None) -> AgentExecutionResult:
         """
         Execute a single agent.
         
         Args:
             agent_id: Agent ID
             input_data: Input data for the agent
+            cancel_token: Optional event that aborts the agent once set
+            node: Agent node, if already resolved (looked up by agent_id otherwise)
         
         Returns:
             AgentExecutionResult
@@ -165,9 +268,11 @@ class Orchestrator:
         logger.debug(f"Input data keys for {agent_id}: {list(input_data.keys())}")
         
         try:
-            agent = self._load_agent(agent_id)
+            if node is None:
+                node = self._get_node(agent_id)
+            agent = self._load_agent(node)
             logger.debug(f"Starting execution of agent: {agent_id}")
-            result = agent.execute(input_data)
+            result = agent.execute(input_data, cancel_token=cancel_token)
             
             status = result['status']
             if status == 'success':
@@ -194,6 +299,57 @@ class Orchestrator:
                 timestamp=datetime.now().isoformat()
             )
     
+    def _run_one(self, agent_id: str, execution_results: Dict[str, AgentExecutionResult],
+                 initial_input: Optional[Dict[str, Any]],
+                 cancel_token: Optional[threading.Event] = None) -> AgentExecutionResult:
+        """
+        Prepare input for and execute one agent of the current level.
+        Safe to call from worker threads: only reads results of earlier levels.
+        
+        Args:
+            agent_id: Agent ID
+            execution_results: Results of already executed levels
+            initial_input: Initial input (for root nodes)
+            cancel_token: Optional event set when a sibling agent failed
+        
+        Returns:
+            AgentExecutionResult
+        """
+        try:
+            node = self._get_node(agent_id)
+            
+            # Check if this is a root node
+            dependencies = get_dependencies(self.dag_config, agent_id)
+            if not dependencies:
+                # Root node - use initial_input
+                logger.debug(f"Agent {agent_id} is a root node (no dependencies)")
+                input_data = initial_input or {}
+            else:
+                # Prepare input from dependencies
+                logger.debug(f"Agent {agent_id} depends on: {dependencies}")
+                input_data = self._prepare_input(node, execution_results)
+            
+            # Execute agent
+            result = self.execute_agent(agent_id, input_data, cancel_token=cancel_token, node=node)
+        except Exception as e:
+            return AgentExecutionResult(
+                agent_id=agent_id,
+                status='error',
+                data=None,
+                error=str(e),
+                timestamp=datetime.now().isoformat()
+            )
+        
+        # Agent-specific reporting registered by the agent's module
+        hook = self._post_hooks.get(agent_id)
+        if hook is not None:
+            try:
+                hook(result)
+            except Exception as e:
+                logger.warning(f"Post-execution hook for {agent_id} failed: {str(e)}")
+        
+        return result
+    
     def execute(self, initial_input: Optional[Dict[str, Any]] = None) -> OrchestrationResult:
         """
         Execute all agents in DAG order.
@@ -215,69 +371,55 @@ class Orchestrator:
         flat_execution_order = []
         
         try:
-            # Execute agents level by level
+            # Execute agents level by level; agents within a level run concurrently
             for level_idx, level in enumerate(self.execution_order):
                 logger.info(f"\n--- Executing Level {level_idx + 1}: {level} ---")
-                # Agents at same level can run in parallel (but we'll run sequentially for simplicity)
-                for agent_id in level:
-                    flat_execution_order.append(agent_id)
-                    
-                    # Prepare input
-                    if agent_id in execution_results:
-                        continue  # Already executed
-                    
-                    try:
-                        # Check if this is a root node
-                        dependencies = get_dependencies(self.dag_config, agent_id)
-                        if not dependencies:
-                            # Root node - use initial_input
-                            logger.debug(f"Agent {agent_id} is a root node (no dependencies)")
-                            input_data = initial_input or {}
-                        else:
-                            # Prepare input from dependencies
-                            logger.debug(f"Agent {agent_id} depends on: {dependencies}")
-                            input_data = self._prepare_input(agent_id, execution_results)
-                        
-                        # Execute agent
-                        result = self.execute_agent(agent_id, input_data)
-                        execution_results[agent_id] = result
-                        
-                        # Log scouting agent results specifically
-                        if agent_id == 'scouting' and result.status == 'success' and result.data:
-                            logger.info("\n" + "="*80)
-                            logger.info("SCOUTING AGENT RESULTS")
-                            logger.info("="*80)
-                            data = result.data
-                            logger.info(f"Total Screened: {data.get('total_screened', 0)}")
-                            logger.info(f"Qualifying Stocks: {data.get('qualifying_count', 0)}")
-                            shortlisted = data.get('shortlisted_stocks', [])
-                            logger.info(f"Shortlisted Stocks: {len(shortlisted)}")
-                            logger.info("-"*80)
-                            for i, stock in enumerate(shortlisted[:10], 1):
-                                logger.info(f"{i}. {stock.get('name', 'N/A')} ({stock.get('symbol', 'N/A')})")
-                                logger.info(f"   Price: ₹{stock.get('current_price', 0):.2f}")
-                                logger.info(f"   ATR: {stock.get('atr_percentage', 0):.2f}%" if stock.get('atr_percentage') else "   ATR: N/A")
-                                logger.info(f"   Avg Volume: {stock.get('avg_volume', 0):,.0f}")
-                                logger.info(f"   Meets Criteria: {'Yes' if stock.get('meets_criteria') else 'No'}")
-                            logger.info("="*80 + "\n")
-                        
-                        # Stop if agent failed (unless configured to continue)
-                        if result.status != 'success':
-                            logger.error(f"Agent {agent_id} failed, stopping execution")
-                            break
-                        else:
-                            logger.info(f"✓ Level {level_idx + 1} completed for {agent_id}")
-                    
-                    except Exception as e:
-                        result = AgentExecutionResult(
-                            agent_id=agent_id,
-                            status='error',
-                            data=None,
-                            error=str(e),
-                            timestamp=datetime.now().isoformat()
-                        )
-                        execution_results[agent_id] = result
-                        break
+                flat_execution_order.extend(level)
+                pending = [agent_id for agent_id in level if agent_id not in execution_results]
+                
+                # Collect this level's results separately so running agents only
+                # ever read results from earlier levels
+                level_results = {}
+                if len(pending) == 1:
+                    level_results[pending[0]] = self._run_one(pending[0], execution_results, initial_input)
+                elif pending:
+                    # Fail fast: the first failure cancels the agent's siblings
+                    cancel_token = threading.Event()
+                    with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="orchestrator") as executor:
+                        futures = {
+                            executor.submit(self._run_one, agent_id, execution_results,
+                                            initial_input, cancel_token): agent_id
+                            for agent_id in pending
+                        }
+                        for future in as_completed(futures):
+                            agent_id = futures[future]
+                            try:
+                                result = future.result()
+                            except CancelledError:
+                                result = AgentExecutionResult(
+                                    agent_id=agent_id,
+                                    status='cancelled',
+                                    error='Cancelled before start',
+                                    timestamp=datetime.now().isoformat()
+                                )
+                            level_results[agent_id] = result
+                            
+                            if result.status == 'error' and not cancel_token.is_set():
+                                logger.error(f"Agent {agent_id} failed, cancelling remaining agents in level")
+                                cancel_token.set()
+                                for other in futures:
+                                    other.cancel()
+                
+                # Keep DAG order in the results regardless of completion order
+                for agent_id in pending:
+                    execution_results[agent_id] = level_results[agent_id]
+                
+                # Stop if any agent in the level failed (unless configured to continue)
+                failed = [agent_id for agent_id in pending if level_results[agent_id].status != 'success']
+                if failed:
+                    logger.error(f"Agents {failed} failed, stopping execution")
+                    break
+                logger.info(f"✓ Level {level_idx + 1} completed for {pending}")
             
             # Aggregate outputs
             logger.info("\nAggregating outputs...")
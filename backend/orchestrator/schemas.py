@@ -3,12 +3,13 @@ Orchestrator Schemas
 Defines schemas for DAG configuration, execution, and aggregation.
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
+from common.compat import DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentNode:
     """Schema for an agent node in the DAG."""
     agent_id: str
@@ -16,19 +17,46 @@ class AgentNode:
     agent_class: str   # e.g., "ScoutingAgent"
     config: Optional[Dict[str, Any]] = None  # Agent-specific configuration
     input_mapping: Optional[Dict[str, str]] = None  # Maps parent outputs to inputs
+    # input_mapping pre-parsed into (input_key, source_agent_id, data_key or None)
+    parsed_inputs: List[Tuple[str, str, Optional[str]]] = field(init=False, repr=False, compare=False,
+                                                                default_factory=list)
+    
+    def __post_init__(self):
+        """Parse "parent_agent.data_key" / "parent_agent" source paths once."""
+        for input_key, source_path in (self.input_mapping or {}).items():
+            source_agent_id, _, data_key = source_path.partition('.')
+            self.parsed_inputs.append((input_key, source_agent_id, data_key or None))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            'agent_id': self.agent_id,
+            'agent_module': self.agent_module,
+            'agent_class': self.agent_class,
+            'config': self.config,
+            'input_mapping': self.input_mapping
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DAGConfig:
     """Schema for declarative DAG configuration."""
     name: str
     description: str
     nodes: List[AgentNode]
     edges: List[Dict[str, str]]  # [{"from": "agent1", "to": "agent2"}, ...]
+    # Lookup indexes built once from nodes/edges (see __post_init__)
+    _node_index: Dict[str, AgentNode] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _deps: Dict[str, List[str]] = field(init=False, repr=False, compare=False, default_factory=dict)
+    _dependents: Dict[str, List[str]] = field(init=False, repr=False, compare=False, default_factory=dict)
+    
+    def __post_init__(self):
+        """Index nodes by ID and edges by endpoint in a single pass each."""
+        for node in self.nodes:
+            self._node_index.setdefault(node.agent_id, node)
+        for edge in self.edges:
+            self._deps.setdefault(edge['to'], []).append(edge['from'])
+            self._dependents.setdefault(edge['from'], []).append(edge['to'])
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -40,11 +68,11 @@ class DAGConfig:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AgentExecutionResult:
     """Schema for agent execution result."""
     agent_id: str
-    status: str  # 'success' or 'error'
+    status: str  # 'success', 'error' or 'cancelled'
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     timestamp: Optional[str] = None
@@ -60,7 +88,7 @@ class AgentExecutionResult:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OrchestrationResult:
     """Schema for final orchestration result."""
     status: str  # 'success' or 'error'
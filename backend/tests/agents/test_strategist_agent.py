@@ -5,6 +5,7 @@ Tests for Strategist Agent.
 import pytest
 from unittest.mock import patch, MagicMock
 from agents.strategist.agent import StrategistAgent
+from tests.fixtures.mock_responses import create_mock_groq_completion
 
 
 @pytest.mark.unit
@@ -13,8 +14,7 @@ class TestStrategistAgent:
     
     @patch('agents.strategist.agent.Groq')
     @patch('agents.strategist.agent.KiteClient')
-    def test_strategist_agent_initialization(self, mock_kite_class, mock_groq_class, 
-                                             mock_environment_variables):
+    def test_strategist_agent_initialization(self, mock_kite_class, mock_groq_class):
         """Test strategist agent initialization."""
         agent = StrategistAgent()
         
@@ -24,26 +24,66 @@ class TestStrategistAgent:
     
     @patch('agents.strategist.agent.Groq')
     @patch('agents.strategist.agent.KiteClient')
-    def test_strategist_agent_decision_making(self, mock_kite_class, mock_groq_class,
-                                               sample_strategist_input, mock_environment_variables):
-        """Test strategist agent decision making."""
-        # Setup mocks
+    def test_strategist_agent_prefilters_holds(self, mock_kite_class, mock_groq_class):
+        """Test that stocks without a bullish signal are not sent to Groq."""
         mock_groq = MagicMock()
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message = MagicMock()
-        mock_response.choices[0].message.content = '{"decisions": [{"symbol": "RELIANCE.NS", "action": "BUY", "confidence": 0.82}]}'
-        mock_groq.chat.completions.create.return_value = mock_response
+        response_text = '{"decisions": [{"symbol": "RELIANCE.NS", "action": "hold", "confidence": 0.5}]}'
+        mock_groq.chat.completions.create.return_value = create_mock_groq_completion(response_text)
         mock_groq_class.return_value = mock_groq
         
-        mock_kite = MagicMock()
-        mock_kite.place_order.return_value = {"order_id": "TEST123"}
-        mock_kite_class.return_value = mock_kite
+        agent = StrategistAgent()
+        
+        input_data = {
+            "technical": {
+                "analyzed_stocks": [
+                    {"symbol": "RELIANCE.NS", "trend": "bullish", "strength": 70},
+                    {"symbol": "TCS.NS", "trend": "bearish", "strength": 30}
+                ]
+            },
+            "sentiment": {
+                "analyzed_stocks": [
+                    {"symbol": "TCS.NS", "overall_sentiment": "negative", "sentiment_score": -0.4}
+                ]
+            }
+        }
+        result = agent.run(input_data)
+        
+        # Only the bullish candidate reaches the prompt
+        prompt = mock_groq.chat.completions.create.call_args.kwargs['messages'][0]['content']
+        assert 'RELIANCE.NS' in prompt
+        assert 'TCS.NS' not in prompt
+        
+        # Filtered stock is still reported as a hold decision
+        assert [d['symbol'] for d in result['decisions']].count('RELIANCE.NS') == 1
+        held = [d for d in result['decisions'] if d['symbol'] == 'TCS.NS']
+        assert len(held) == 1
+        assert held[0]['action'] == 'hold'
+        assert held[0]['confidence'] == 0.0
+        
+        # JSON mode is requested without streaming
+        call_kwargs = mock_groq.chat.completions.create.call_args.kwargs
+        assert call_kwargs['response_format'] == {"type": "json_object"}
+        assert 'stream' not in call_kwargs
+    
+    @patch('agents.strategist.agent.Groq')
+    @patch('agents.strategist.agent.KiteClient')
+    def test_strategist_agent_raises_on_groq_error(self, mock_kite_class, mock_groq_class):
+        """Test that a failed Groq call is surfaced instead of reported as all holds."""
+        mock_groq = MagicMock()
+        mock_groq.chat.completions.create.side_effect = RuntimeError("json_object does not support streaming")
+        mock_groq_class.return_value = mock_groq
         
         agent = StrategistAgent()
         
-        # Execute agent
-        result = agent.run(sample_strategist_input)
+        input_data = {
+            "technical": {
+                "analyzed_stocks": [
+                    {"symbol": "RELIANCE.NS", "trend": "bullish", "strength": 70},
+                    {"symbol": "TCS.NS", "trend": "bearish", "strength": 30}
+                ]
+            },
+            "sentiment": {"analyzed_stocks": []}
+        }
         
-        # Verify output structure
-        assert 'trading_decisions' in result or 'decisions' in result
+        with pytest.raises(RuntimeError):
+            agent.run(input_data)
@@ -4,65 +4,180 @@ Shared pytest fixtures and configuration.
 
 import os
 import pytest
-from unittest.mock import Mock, MagicMock, patch
-from typing import Dict, Any
-import pandas as pd
-from datetime import datetime
-
-# Import project modules
-from common.cache import Cache
-from agents.scouting.data_provider import StockDataProvider
-from tests.fixtures.mock_data import (
-    create_mock_historical_data,
-    create_mock_stock_info,
-    SAMPLE_NIFTY50_SYMBOLS,
-    SAMPLE_SHORTLISTED_STOCKS
-)
-from tests.fixtures.mock_responses import (
-    create_mock_groq_sentiment_response,
-    create_mock_groq_decision_response,
-    create_mock_groq_data_sufficiency_response,
-    create_mock_news_api_response,
-    create_mock_kite_order_response
-)
+from pathlib import Path
+from unittest.mock import Mock
 
 
 # Check if real APIs should be used (for integration testing)
 USE_REAL_APIS = os.getenv("USE_REAL_APIS", "false").lower() == "true"
 
+# Fake credentials applied for the whole session; tests needing other values
+# can still override them with monkeypatch.setenv
+_TEST_ENV = {
+    "GROQ_API_KEY": "test_groq_key",
+    "NEWS_API_KEY": "test_news_key",
+    "NEWS_API_URL": "https://test-api.example.com",
+    "KITE_API_KEY": "test_kite_key",
+    "KITE_API_SECRET": "test_kite_secret",
+    "KITE_ACCESS_TOKEN": "test_access_token",
+}
+
+# Sample agent inputs/outputs, built once at import. Agents only read their
+# input, so fixtures hand out these shared objects; do not mutate them in tests.
+_SAMPLE_SCOUTING_INPUT = {"top_n": 10}
+
+_SAMPLE_TECHNICAL_INPUT = {
+    "stocks": [
+        {"symbol": "RELIANCE.NS", "name": "Reliance Industries Ltd", "current_price": 2450.50},
+        {"symbol": "TCS.NS", "name": "Tata Consultancy Services", "current_price": 3500.00}
+    ]
+}
+
+_SAMPLE_TECHNICAL_OUTPUT = {
+    "technical_signals": [
+        {
+            "symbol": "RELIANCE.NS",
+            "signal": "BUY",
+            "confidence": 0.75,
+            "indicators": {
+                "rsi": 55.0,
+                "macd": 12.5,
+                "sma_50": 2400.0
+            }
+        }
+    ]
+}
+
+_SAMPLE_SENTIMENT_INPUT = {
+    "stocks": [
+        {"symbol": "RELIANCE.NS", "name": "Reliance Industries Ltd"},
+        {"symbol": "TCS.NS", "name": "Tata Consultancy Services"}
+    ]
+}
+
+_SAMPLE_SENTIMENT_OUTPUT = {
+    "analyzed_stocks": [
+        {
+            "symbol": "RELIANCE.NS",
+            "name": "Reliance Industries Ltd",
+            "overall_sentiment": "positive",
+            "sentiment_score": 0.75,
+            "confidence": 0.85
+        }
+    ],
+    "total_analyzed": 2,
+    "positive_count": 1,
+    "negative_count": 0,
+    "neutral_count": 1
+}
+
+_SAMPLE_STRATEGIST_INPUT = {
+    "technical": {
+        "technical_signals": [
+            {
+                "symbol": "RELIANCE.NS",
+                "signal": "BUY",
+                "confidence": 0.75
+            }
+        ]
+    },
+    "sentiment": {
+        "analyzed_stocks": [
+            {
+                "symbol": "RELIANCE.NS",
+                "overall_sentiment": "positive",
+                "sentiment_score": 0.75
+            }
+        ]
+    }
+}
+
+# Test directories holding only tests of a given marker. When pytest is run
+# with exactly `-m unit` or `-m integration`, the other directories are not
+# collected at all, so their modules (and the agents they import) are never
+# loaded.
+_MARKER_DIRS = {
+    "unit": ("unit", "agents"),
+    "integration": ("integration",),
+}
+_TESTS_ROOT = Path(__file__).parent
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Skip collecting marker-specific test directories the -m expression can't select."""
+    selected = _MARKER_DIRS.get(config.getoption("markexpr", "").strip())
+    if selected is None or collection_path.parent != _TESTS_ROOT:
+        return None
+    
+    name = collection_path.name
+    is_marker_dir = any(name in dirs for dirs in _MARKER_DIRS.values())
+    return True if is_marker_dir and name not in selected else None
+
 
 @pytest.fixture
 def isolated_cache():
     """Provide an isolated cache instance for each test."""
+    from common.cache import Cache
     return Cache()
 
 
+@pytest.fixture(scope="session")
+def mock_historical_data():
+    """Mock historical price data, built once per session (tests treat it as read-only)."""
+    from tests.fixtures.mock_data import create_mock_historical_data
+    # ~3 months of bars, as the technical agent fetches; its indicators need at least 50
+    return create_mock_historical_data(days=90)
+
+
+@pytest.fixture(scope="session")
+def mock_stock_info():
+    """Mock stock information, built once per session (tests treat it as read-only)."""
+    from tests.fixtures.mock_data import create_mock_stock_info
+    return create_mock_stock_info()
+
+
+@pytest.fixture
+def mock_data_provider(mock_historical_data, mock_stock_info):
+    """Stub StockDataProvider returning the session's mock data."""
+    from tests.fixtures.mock_data import StubDataProvider
+    return StubDataProvider(historical_data=mock_historical_data, stock_info=mock_stock_info)
+
+
+@pytest.fixture
+def light_data_provider():
+    """Stub StockDataProvider without canned data, for tests that never fetch prices."""
+    # Requesting this instead of mock_data_provider skips building the mock DataFrame
+    from tests.fixtures.mock_data import StubDataProvider
+    return StubDataProvider()
+
+
 @pytest.fixture
-def mock_data_provider():
-    """Mock StockDataProvider."""
-    provider = Mock(spec=StockDataProvider)
+def scouting_mocks(mocker):
+    """Patch the scouting tools used by ScoutingAgent and return the mocks."""
+    from tests.fixtures.mock_data import SAMPLE_STOCK_SCREENING_RESULT
     
-    # Mock fetch_historical_data
-    provider.fetch_historical_data.return_value = create_mock_historical_data()
+    mock_nifty50 = mocker.patch('agents.scouting.agent.get_nifty50_symbols')
+    mock_screen = mocker.patch('agents.scouting.agent.screen_stocks')
+    mock_shortlist = mocker.patch('agents.scouting.agent.shortlist_stocks')
     
-    # Mock fetch_stock_info
-    provider.fetch_stock_info.return_value = create_mock_stock_info()
+    mock_nifty50.return_value = ["RELIANCE.NS", "TCS.NS"]
+    mock_screen.return_value = [SAMPLE_STOCK_SCREENING_RESULT]
+    mock_shortlist.return_value = mock_screen.return_value[:1]
     
-    return provider
+    return mock_nifty50, mock_screen, mock_shortlist
 
 
 @pytest.fixture
 def mock_groq_client():
     """Mock Groq client."""
+    from tests.fixtures.mock_responses import (
+        create_mock_groq_completion,
+        create_mock_groq_sentiment_response
+    )
     client = Mock()
-    
-    # Mock chat.completions.create
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.content = create_mock_groq_sentiment_response()
-    
-    client.chat.completions.create.return_value = mock_response
+    client.chat.completions.create.return_value = create_mock_groq_completion(
+        create_mock_groq_sentiment_response()
+    )
     
     return client
 
@@ -70,14 +185,14 @@ def mock_groq_client():
 @pytest.fixture
 def mock_groq_client_decision():
     """Mock Groq client for decision making."""
+    from tests.fixtures.mock_responses import (
+        create_mock_groq_completion,
+        create_mock_groq_decision_response
+    )
     client = Mock()
-    
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.content = create_mock_groq_decision_response()
-    
-    client.chat.completions.create.return_value = mock_response
+    client.chat.completions.create.return_value = create_mock_groq_completion(
+        create_mock_groq_decision_response()
+    )
     
     return client
 
@@ -85,14 +200,14 @@ def mock_groq_client_decision():
 @pytest.fixture
 def mock_groq_client_data_sufficiency():
     """Mock Groq client for data sufficiency reasoning."""
+    from tests.fixtures.mock_responses import (
+        create_mock_groq_completion,
+        create_mock_groq_data_sufficiency_response
+    )
     client = Mock()
-    
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.content = create_mock_groq_data_sufficiency_response(sufficient=False)
-    
-    client.chat.completions.create.return_value = mock_response
+    client.chat.completions.create.return_value = create_mock_groq_completion(
+        create_mock_groq_data_sufficiency_response(sufficient=False)
+    )
     
     return client
 
@@ -100,6 +215,7 @@ def mock_groq_client_data_sufficiency():
 @pytest.fixture
 def mock_kite_client():
     """Mock Kite client."""
+    from tests.fixtures.mock_responses import create_mock_kite_order_response
     client = Mock()
     client.place_order.return_value = create_mock_kite_order_response()
     client.paper_trading = True
@@ -109,12 +225,13 @@ def mock_kite_client():
 @pytest.fixture
 def sample_scouting_input():
     """Sample input for scouting agent."""
-    return {"top_n": 10}
+    return _SAMPLE_SCOUTING_INPUT
 
 
 @pytest.fixture
 def sample_scouting_output():
     """Sample output from scouting agent."""
+    from tests.fixtures.mock_data import SAMPLE_SHORTLISTED_STOCKS
     return {
         "shortlisted_stocks": SAMPLE_SHORTLISTED_STOCKS,
         "total_screened": 50,
@@ -129,84 +246,31 @@ def sample_scouting_output():
 @pytest.fixture
 def sample_technical_input():
     """Sample input for technical agent."""
-    return {
-        "stocks": ["RELIANCE.NS", "TCS.NS"]
-    }
+    return _SAMPLE_TECHNICAL_INPUT
 
 
 @pytest.fixture
 def sample_technical_output():
     """Sample output from technical agent."""
-    return {
-        "technical_signals": [
-            {
-                "symbol": "RELIANCE.NS",
-                "signal": "BUY",
-                "confidence": 0.75,
-                "indicators": {
-                    "rsi": 55.0,
-                    "macd": 12.5,
-                    "sma_50": 2400.0
-                }
-            }
-        ]
-    }
+    return _SAMPLE_TECHNICAL_OUTPUT
 
 
 @pytest.fixture
 def sample_sentiment_input():
     """Sample input for sentiment agent."""
-    return {
-        "stocks": [
-            {"symbol": "RELIANCE.NS", "name": "Reliance Industries Ltd"},
-            {"symbol": "TCS.NS", "name": "Tata Consultancy Services"}
-        ]
-    }
+    return _SAMPLE_SENTIMENT_INPUT
 
 
 @pytest.fixture
 def sample_sentiment_output():
     """Sample output from sentiment agent."""
-    return {
-        "analyzed_stocks": [
-            {
-                "symbol": "RELIANCE.NS",
-                "name": "Reliance Industries Ltd",
-                "overall_sentiment": "positive",
-                "sentiment_score": 0.75,
-                "confidence": 0.85
-            }
-        ],
-        "total_analyzed": 2,
-        "positive_count": 1,
-        "negative_count": 0,
-        "neutral_count": 1
-    }
+    return _SAMPLE_SENTIMENT_OUTPUT
 
 
 @pytest.fixture
 def sample_strategist_input():
     """Sample input for strategist agent."""
-    return {
-        "technical": {
-            "technical_signals": [
-                {
-                    "symbol": "RELIANCE.NS",
-                    "signal": "BUY",
-                    "confidence": 0.75
-                }
-            ]
-        },
-        "sentiment": {
-            "analyzed_stocks": [
-                {
-                    "symbol": "RELIANCE.NS",
-                    "overall_sentiment": "positive",
-                    "sentiment_score": 0.75
-                }
-            ]
-        }
-    }
+    return _SAMPLE_STRATEGIST_INPUT
 
 
 @pytest.fixture
@@ -215,15 +279,26 @@ def mock_news_api(monkeypatch):
     if USE_REAL_APIS:
         return None
     
+    import agents.sentiment.sentiment_agent as sentiment_agent
+    
     def mock_fetch_news(*args, **kwargs):
+        from agents.sentiment.sentiment_schemas import NewsArticle
         from tests.fixtures.mock_responses import create_mock_news_api_response
-        return create_mock_news_api_response(article_count=10)
+        response = create_mock_news_api_response(article_count=10)
+        return [
+            NewsArticle(
+                title=item["title"],
+                description=item["body"],
+                published_date=item["date"],
+                source=item["source"]["title"]
+            )
+            for item in response["articles"]["results"]
+        ]
     
-    # Mock the news provider
-    monkeypatch.setattr(
-        "agents.sentiment.social_media_tools._default_news_provider.fetch_news",
-        lambda *args, **kwargs: []
-    )
+    # Patch the name the sentiment agent imported and registers as its fetch_news
+    # tool (patching social_media_tools.fetch_news would not reach it); agents
+    # must be created after this fixture runs
+    monkeypatch.setattr(sentiment_agent, "fetch_news", mock_fetch_news)
     
     return mock_fetch_news
 
@@ -234,33 +309,30 @@ def mock_reddit_api(monkeypatch):
     if USE_REAL_APIS:
         return None
     
+    import agents.sentiment.sentiment_agent as sentiment_agent
+    
     def mock_fetch_reddit(*args, **kwargs):
         from tests.fixtures.mock_data import create_mock_reddit_mentions
         return create_mock_reddit_mentions(count=5)
     
-    monkeypatch.setattr(
-        "agents.sentiment.social_media_tools.fetch_reddit_mentions",
-        mock_fetch_reddit
-    )
+    # Patch the name the sentiment agent imported and registers as a tool
+    monkeypatch.setattr(sentiment_agent, "fetch_reddit_mentions", mock_fetch_reddit)
     
     return mock_fetch_reddit
 
 
-@pytest.fixture(autouse=True)
-def reset_cache():
-    """Reset global cache before each test."""
-    from common.cache import _cache
-    _cache._cache.clear()
+@pytest.fixture(scope="session", autouse=True)
+def test_environment_variables():
+    """Set fake API credentials once for the whole session, restoring the originals after."""
+    if USE_REAL_APIS:
+        yield
+        return
+    
+    original = {key: os.environ.get(key) for key in _TEST_ENV}
+    os.environ.update(_TEST_ENV)
     yield
-    _cache._cache.clear()
-
-
-@pytest.fixture
-def mock_environment_variables(monkeypatch):
-    """Mock environment variables for testing."""
-    monkeypatch.setenv("GROQ_API_KEY", "test_groq_key")
-    monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
-    monkeypatch.setenv("NEWS_API_URL", "https://test-api.example.com")
-    monkeypatch.setenv("KITE_API_KEY", "test_kite_key")
-    monkeypatch.setenv("KITE_API_SECRET", "test_kite_secret")
-    monkeypatch.setenv("KITE_ACCESS_TOKEN", "test_access_token")
+    for key, value in original.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
@@ -2,10 +2,15 @@
 Mock data for testing.
 """
 
-from typing import Dict, List, Any
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+from agents.scouting.schemas import StockScreeningResult
 
 
 # Sample Nifty 50 symbols
@@ -28,6 +33,20 @@ SAMPLE_SCREENING_RESULT = {
     "score": 85.5
 }
 
+# Sample screening result as the scouting tools return it (built once at import)
+SAMPLE_STOCK_SCREENING_RESULT = StockScreeningResult(
+    symbol="RELIANCE.NS",
+    name="Reliance",
+    current_price=2450.0,
+    atr_percentage=2.5,
+    avg_volume=5000000,
+    recent_volume=6000000,
+    volume_ratio=1.2,
+    meets_criteria=True,
+    criteria_details=[],
+    score=85.0
+)
+
 # Sample shortlisted stocks
 SAMPLE_SHORTLISTED_STOCKS = [
     {
@@ -57,25 +76,29 @@ SAMPLE_SHORTLISTED_STOCKS = [
 ]
 
 
+@lru_cache(maxsize=32)
 def create_mock_historical_data(symbol: str = "RELIANCE.NS", days: int = 30) -> pd.DataFrame:
-    """Create mock historical stock data."""
+    """
+    Create mock historical stock data.
+    
+    Prices are drawn from an RNG seeded on (symbol, days), so the output is
+    a pure function of its arguments. The result is memoized; callers must
+    treat the returned DataFrame as read-only.
+    """
+    # crc32 rather than hash(): str hashes are randomized per interpreter run
+    rng = np.random.default_rng(zlib.crc32(f"{symbol}:{days}".encode()))
     dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
     
-    # Generate realistic-looking price data
-    base_price = 2450.0
-    prices = []
-    for i in range(days):
-        # Random walk with slight upward trend
-        change = np.random.normal(0.5, 15)  # Mean 0.5, std 15
-        base_price = max(base_price + change, 100)  # Don't go below 100
-        prices.append(base_price)
+    # Generate realistic-looking price data: random walk with slight upward trend
+    changes = rng.normal(0.5, 15, days)  # Mean 0.5, std 15
+    prices = np.maximum(np.cumsum(changes) + 2450.0, 100.0)  # Don't go below 100
     
     data = {
-        'Open': [p * 0.99 for p in prices],
-        'High': [p * 1.02 for p in prices],
-        'Low': [p * 0.98 for p in prices],
+        'Open': prices * 0.99,
+        'High': prices * 1.02,
+        'Low': prices * 0.98,
         'Close': prices,
-        'Volume': np.random.randint(1000000, 10000000, days)
+        'Volume': rng.integers(1000000, 10000000, days)
     }
     
     df = pd.DataFrame(data, index=dates)
@@ -93,8 +116,29 @@ def create_mock_stock_info(symbol: str = "RELIANCE.NS") -> Dict[str, Any]:
     }
 
 
+@dataclass
+class StubDataProvider:
+    """
+    Lightweight stand-in for StockDataProvider returning canned data.
+    
+    Much cheaper than a Mock; wrap it in ``Mock(wraps=...)`` in tests that
+    need to assert on calls.
+    """
+    historical_data: Optional[pd.DataFrame] = None
+    stock_info: Optional[Dict[str, Any]] = None
+    
+    def fetch_historical_data(self, symbol: str, period: str = "1mo") -> Optional[pd.DataFrame]:
+        """Return the canned historical data regardless of symbol."""
+        return self.historical_data
+    
+    def fetch_stock_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return the canned stock info regardless of symbol."""
+        return self.stock_info
+
+
+@lru_cache(maxsize=32)
 def create_mock_news_articles(count: int = 10) -> List[Dict[str, Any]]:
-    """Create mock news articles."""
+    """Create mock news articles (memoized; treat as read-only)."""
     articles = []
     for i in range(count):
         articles.append({
@@ -106,8 +150,9 @@ def create_mock_news_articles(count: int = 10) -> List[Dict[str, Any]]:
     return articles
 
 
+@lru_cache(maxsize=32)
 def create_mock_reddit_mentions(count: int = 5) -> List[Dict[str, Any]]:
-    """Create mock Reddit mentions."""
+    """Create mock Reddit mentions (memoized; treat as read-only)."""
     mentions = []
     for i in range(count):
         mentions.append({
@@ -2,12 +2,13 @@
 Mock API responses for testing.
 """
 
+from functools import lru_cache
 from typing import Dict, Any
+from unittest.mock import Mock
 
 
-def create_mock_groq_sentiment_response() -> str:
-    """Create mock Groq LLM response for sentiment analysis."""
-    return """{
+# Groq LLM response bodies, shared by the factories below
+_SENTIMENT_RESPONSE_JSON = """{
         "overall_sentiment": "positive",
         "sentiment_score": 0.75,
         "confidence": 0.85,
@@ -23,10 +24,7 @@ def create_mock_groq_sentiment_response() -> str:
         "recommendation": "buy"
     }"""
 
-
-def create_mock_groq_decision_response() -> str:
-    """Create mock Groq LLM response for trading decision."""
-    return """{
+_DECISION_RESPONSE_JSON = """{
         "decisions": [
             {
                 "symbol": "RELIANCE.NS",
@@ -39,17 +37,13 @@ def create_mock_groq_decision_response() -> str:
         ]
     }"""
 
-
-def create_mock_groq_data_sufficiency_response(sufficient: bool = False) -> str:
-    """Create mock Groq LLM response for data sufficiency reasoning."""
-    if sufficient:
-        return """{
+_SUFFICIENCY_TRUE_JSON = """{
             "sufficient": true,
             "reasoning": "Adequate number of articles found for reliable sentiment analysis",
             "recommended_action": "proceed_with_analysis"
         }"""
-    else:
-        return """{
+
+_SUFFICIENCY_FALSE_JSON = """{
             "sufficient": false,
             "reasoning": "Only 5 articles found, need at least 10 for reliable sentiment",
             "recommended_action": "expand_timeframe",
@@ -57,6 +51,32 @@ def create_mock_groq_data_sufficiency_response(sufficient: bool = False) -> str:
         }"""
 
 
+def create_mock_groq_sentiment_response() -> str:
+    """Create mock Groq LLM response for sentiment analysis."""
+    return _SENTIMENT_RESPONSE_JSON
+
+
+def create_mock_groq_decision_response() -> str:
+    """Create mock Groq LLM response for trading decision."""
+    return _DECISION_RESPONSE_JSON
+
+
+def create_mock_groq_data_sufficiency_response(sufficient: bool = False) -> str:
+    """Create mock Groq LLM response for data sufficiency reasoning."""
+    return _SUFFICIENCY_TRUE_JSON if sufficient else _SUFFICIENCY_FALSE_JSON
+
+
+@lru_cache(maxsize=None)
+def create_mock_groq_completion(content: str) -> Mock:
+    """
+    Create a mock (non-streamed) Groq chat completion carrying the given content.
+    
+    Completions are cached per content and shared between tests, which only
+    read ``choices[0].message.content`` from them.
+    """
+    return Mock(choices=[Mock(message=Mock(content=content))])
+
+
 def create_mock_news_api_response(article_count: int = 10) -> Dict[str, Any]:
     """Create mock Event Registry News API response."""
     articles = []
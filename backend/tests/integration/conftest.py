@@ -0,0 +1,41 @@
+"""
+Fixtures shared by the integration tests.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+
+@pytest.fixture(scope="session")
+def _fake_agent_module_template():
+    """Fake agent module, built once per session."""
+    mock_agent = MagicMock()
+    mock_agent.run.return_value = {"shortlisted_stocks": []}
+    
+    module = MagicMock()
+    module.create_agent = MagicMock(return_value=mock_agent)
+    module.ScoutingAgent = MagicMock(return_value=mock_agent)
+    return module
+
+
+@pytest.fixture
+def fake_agent_module(_fake_agent_module_template):
+    """Fake agent module for patched importlib.import_module, with call records cleared."""
+    # reset_mock keeps configured return values, so this is far cheaper than a rebuild
+    _fake_agent_module_template.reset_mock()
+    return _fake_agent_module_template
+
+
+@pytest.fixture
+def patched_agent_import(mocker, fake_agent_module):
+    """Make the orchestrator's agent module imports return the fake agent module."""
+    return mocker.patch('orchestrator.main.importlib.import_module', return_value=fake_agent_module)
+
+
+@pytest.fixture(autouse=True)
+def reset_agent_cache():
+    """Reset process-wide orchestrator agent cache before each integration test."""
+    from orchestrator.main import clear_agent_cache
+    clear_agent_cache()
+    yield
+    clear_agent_cache()
@@ -0,0 +1,102 @@
+"""
+Integration tests for the FastAPI execution history endpoints.
+"""
+
+import asyncio
+from collections import deque
+from unittest.mock import Mock
+import numpy as np
+import orjson
+import pytest
+import main
+
+
+@pytest.fixture
+def empty_history(monkeypatch):
+    """Give each test its own empty execution history."""
+    monkeypatch.setattr(main, "execution_history", deque(maxlen=100))
+    monkeypatch.setattr(main, "_history_snapshot", ())
+
+
+@pytest.fixture
+def fresh_orchestrator_factory(mocker):
+    """Empty the custom-DAG orchestrator memo and build a distinct Mock per config."""
+    main._orchestrator_for.cache_clear()
+    create = mocker.patch.object(main, "create_orchestrator", side_effect=lambda dag_config: Mock())
+    yield create
+    main._orchestrator_for.cache_clear()
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("empty_history")
+class TestExecutionHistory:
+    """Test execution history endpoints."""
+    
+    def test_executions_serialize_numpy_agent_data(self):
+        """Test that numpy values in raw agent data are served instead of failing with a 500."""
+        main._store_execution("exec_1", {
+            "technical": {
+                "strength": np.float64(61.5),
+                "volume": np.int64(1200),
+                "closes": np.array([1.0, 2.5]),
+                "rsi": np.longdouble(42.0)
+            }
+        })
+        
+        response = asyncio.run(main.get_executions(limit=10))
+        body = orjson.loads(response.body)
+        
+        assert body["total"] == 1
+        technical = body["executions"][0]["result"]["technical"]
+        assert technical == {"strength": 61.5, "volume": 1200, "closes": [1.0, 2.5], "rsi": 42.0}
+        
+        record = orjson.loads(asyncio.run(main.get_execution("exec_1")).body)
+        assert record["result"]["technical"]["strength"] == 61.5
+    
+    def test_store_execution_keeps_last_100(self):
+        """Test that the history is bounded and evicts the oldest executions first."""
+        for i in range(105):
+            main._store_execution(f"exec_{i}", {})
+        
+        body = orjson.loads(asyncio.run(main.get_executions(limit=200)).body)
+        
+        assert body["total"] == 100
+        assert body["executions"][0]["execution_id"] == "exec_5"
+        assert body["executions"][-1]["execution_id"] == "exec_104"
+    
+    def test_history_snapshot_is_immutable(self):
+        """Test that readers keep a consistent view while new executions are stored."""
+        main._store_execution("exec_1", {})
+        snapshot = main._history_snapshot
+        
+        main._store_execution("exec_2", {}, status="failed", error="boom")
+        
+        assert isinstance(snapshot, tuple)
+        assert [record["execution_id"] for record in snapshot] == ["exec_1"]
+        assert [record["execution_id"] for record in main._history_snapshot] == ["exec_1", "exec_2"]
+        assert main._history_snapshot[-1]["status"] == "failed"
+
+
+@pytest.mark.integration
+class TestCustomDagOrchestrators:
+    """Test memoization of orchestrators built from request DAG configs."""
+    
+    def test_orchestrator_for_reuses_equal_configs(self, fresh_orchestrator_factory):
+        """Test that equal DAG configs (in any key order) share one orchestrator."""
+        config_a = {"name": "custom", "nodes": [], "edges": []}
+        config_b = {"edges": [], "nodes": [], "name": "custom"}
+        
+        first = main._orchestrator_for(main.json.dumps(config_a, sort_keys=True))
+        second = main._orchestrator_for(main.json.dumps(config_b, sort_keys=True))
+        other = main._orchestrator_for(main.json.dumps({"name": "other"}, sort_keys=True))
+        
+        assert first is second
+        assert other is not first
+        assert fresh_orchestrator_factory.call_count == 2
+        fresh_orchestrator_factory.assert_any_call(dag_config=config_a)
+        
+        # Requests carrying a DAG config run on the memoized orchestrator
+        result = main._execute_dag(main.ExecutionRequest(dag_config=config_b, initial_input={"top_n": 5}))
+        first.execute.assert_called_once_with(initial_input={"top_n": 5})
+        assert result is first.execute.return_value
+        assert fresh_orchestrator_factory.call_count == 2
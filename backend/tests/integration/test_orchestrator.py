@@ -2,25 +2,68 @@
 Integration tests for Orchestrator.
 """
 
+import copy
+import threading
+import time
+from types import SimpleNamespace
 import pytest
-from unittest.mock import patch, MagicMock
-from orchestrator.main import Orchestrator
+from common.base_agent import BaseAgent, raise_if_cancelled
+from orchestrator.dag import TRADING_DAG_CONFIG, DAGValidationError
+from orchestrator.main import Orchestrator, clear_agent_cache
+
+
+class FakeAgent(BaseAgent):
+    """Agent whose run behaviour is supplied by the test."""
+    
+    def __init__(self, agent_name, run_fn):
+        super().__init__(agent_name=agent_name)
+        self.run_fn = run_fn
+        self.run_count = 0
+    
+    def validate_input(self, input_data):
+        return True
+    
+    def run(self, input_data):
+        self.run_count += 1
+        return self.run_fn(input_data)
+
+
+def _wait_until_cancelled(timeout=5.0):
+    """Run body that only ends when a sibling failure cancels it."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        raise_if_cancelled()
+        time.sleep(0.01)
+    return {'analyzed_stocks': []}
+
+
+def _fail(input_data):
+    raise RuntimeError("technical data unavailable")
+
+
+@pytest.fixture
+def install_fake_agents(mocker):
+    """Serve the trading DAG's agent modules from FakeAgents keyed by agent_id."""
+    def install(agents):
+        modules = {
+            node['agent_module']: SimpleNamespace(
+                create_agent=lambda config, agent=agents[node['agent_id']]: agent,
+                **{node['agent_class']: FakeAgent}
+            )
+            for node in TRADING_DAG_CONFIG['nodes']
+        }
+        mocker.patch('orchestrator.main.importlib.import_module', side_effect=modules.__getitem__)
+        return agents
+    return install
 
 
 @pytest.mark.integration
 class TestOrchestrator:
     """Test Orchestrator DAG execution."""
     
-    @patch('orchestrator.main.importlib.import_module')
-    def test_orchestrator_initialization(self, mock_import):
+    @pytest.mark.usefixtures("patched_agent_import")
+    def test_orchestrator_initialization(self):
         """Test orchestrator initialization with DAG config."""
-        # Mock agent modules
-        mock_module = MagicMock()
-        mock_agent_class = MagicMock()
-        mock_module.ScoutingAgent = mock_agent_class
-        mock_agent_class.return_value = MagicMock()
-        mock_import.return_value = mock_module
-        
         orchestrator = Orchestrator()
         
         assert orchestrator is not None
@@ -28,17 +71,9 @@ class TestOrchestrator:
         assert hasattr(orchestrator, 'execution_order')
         assert len(orchestrator.execution_order) > 0
     
-    @patch('orchestrator.main.importlib.import_module')
-    def test_orchestrator_execution_order(self, mock_import):
+    @pytest.mark.usefixtures("patched_agent_import")
+    def test_orchestrator_execution_order(self):
         """Test that orchestrator resolves correct execution order."""
-        # Mock agent modules
-        mock_module = MagicMock()
-        mock_agent_class = MagicMock()
-        mock_module.ScoutingAgent = mock_agent_class
-        mock_module.create_agent = MagicMock(return_value=MagicMock())
-        mock_agent_class.return_value = MagicMock()
-        mock_import.return_value = mock_module
-        
         orchestrator = Orchestrator()
         
         # Verify execution order: scouting should be first (no dependencies)
@@ -49,3 +84,77 @@ class TestOrchestrator:
         if len(orchestrator.execution_order) > 1:
             second_level = orchestrator.execution_order[1]
             assert 'technical' in second_level or 'sentiment' in second_level
+    
+    def test_orchestrator_rejects_invalid_dag(self):
+        """Test that a misconfigured DAG fails at construction, before any agent runs."""
+        dag_config = copy.deepcopy(TRADING_DAG_CONFIG)
+        # Drop the scouting -> technical edge that technical's input mapping relies on
+        dag_config['edges'] = [
+            edge for edge in dag_config['edges']
+            if (edge['from'], edge['to']) != ('scouting', 'technical')
+        ]
+        
+        with pytest.raises(DAGValidationError):
+            Orchestrator(dag_config=dag_config)
+    
+    def test_clear_agent_cache_closes_agents(self, patched_agent_import, fake_agent_module):
+        """Test that evicted agents are closed so their thread pools are released."""
+        orchestrator = Orchestrator()
+        agent = orchestrator._load_agent(orchestrator._get_node('scouting'))
+        
+        # Second load reuses the cached instance
+        assert Orchestrator()._load_agent(orchestrator._get_node('scouting')) is agent
+        agent.close.assert_not_called()
+        
+        clear_agent_cache()
+        agent.close.assert_called_once()
+
+
+@pytest.mark.integration
+class TestOrchestratorLevelExecution:
+    """Test concurrent execution of a DAG level and fail-fast cancellation."""
+    
+    def test_level_agents_run_concurrently(self, install_fake_agents):
+        """Test that technical and sentiment run at the same time within their level."""
+        # Each sibling waits for the other, which only succeeds if they overlap
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def analyze(input_data):
+            barrier.wait()
+            return {'analyzed_stocks': []}
+        
+        agents = install_fake_agents({
+            'scouting': FakeAgent('scouting', lambda input_data: {'shortlisted_stocks': []}),
+            'technical': FakeAgent('technical', analyze),
+            'sentiment': FakeAgent('sentiment', analyze),
+            'strategist': FakeAgent('strategist', lambda input_data: {'decisions': []})
+        })
+        
+        result = Orchestrator().execute(initial_input={'top_n': 10})
+        
+        assert result.status == 'success'
+        assert [r.status for r in result.execution_results] == ['success'] * 4
+        assert result.execution_order[0] == 'scouting'
+        assert set(result.execution_order[1:3]) == {'technical', 'sentiment'}
+        assert result.execution_order[3] == 'strategist'
+        assert all(agent.run_count == 1 for agent in agents.values())
+    
+    def test_failed_agent_cancels_siblings_and_stops(self, install_fake_agents):
+        """Test that a failure cancels the running sibling and skips later levels."""
+        agents = install_fake_agents({
+            'scouting': FakeAgent('scouting', lambda input_data: {'shortlisted_stocks': []}),
+            'technical': FakeAgent('technical', _fail),
+            'sentiment': FakeAgent('sentiment', lambda input_data: _wait_until_cancelled()),
+            'strategist': FakeAgent('strategist', lambda input_data: {'decisions': []})
+        })
+        
+        result = Orchestrator().execute(initial_input={'top_n': 10})
+        
+        statuses = {r.agent_id: r.status for r in result.execution_results}
+        assert result.status == 'error'
+        assert statuses == {'scouting': 'success', 'technical': 'error', 'sentiment': 'cancelled'}
+        
+        # Execution stopped after the failed level
+        assert 'strategist' not in result.execution_order
+        assert set(result.execution_order) == {'scouting', 'technical', 'sentiment'}
+        assert agents['strategist'].run_count == 0
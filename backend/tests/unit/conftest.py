@@ -0,0 +1,52 @@
+"""
+Fixtures shared by the unit tests.
+"""
+
+import pytest
+from agents.sentiment.agent_tools import ToolRegistry, Tool
+
+
+def _mock_fetch_news(symbol, days=14):
+    return [f"Article about {symbol}"]
+
+
+def _add_numbers(a, b):
+    return a + b
+
+
+# Canonical tools, built once at import
+_FETCH_NEWS_TOOL = Tool(
+    name="fetch_news",
+    description="Fetch news articles",
+    parameters={"type": "object", "properties": {"symbol": {"type": "string"}}},
+    function=_mock_fetch_news
+)
+
+_ADD_TOOL = Tool(
+    name="add",
+    description="Add two numbers",
+    parameters={
+        "type": "object",
+        "properties": {"a": {"type": "number"}, "b": {"type": "number"}},
+        "required": ["a", "b"]
+    },
+    function=_add_numbers
+)
+
+
+@pytest.fixture(scope="session")
+def fetch_news_tool():
+    """Mock news-fetching tool."""
+    return _FETCH_NEWS_TOOL
+
+
+@pytest.fixture(scope="session")
+def base_registry():
+    """
+    ToolRegistry pre-populated with the fetch_news and add tools, built once per session.
+    Treat it as read-only; tests that register tools should use their own ToolRegistry.
+    """
+    registry = ToolRegistry()
+    registry.register(_FETCH_NEWS_TOOL)
+    registry.register(_ADD_TOOL)
+    return registry
@@ -2,9 +2,10 @@
 Unit tests for BaseAgent contract.
 """
 
+import threading
 import pytest
 from unittest.mock import Mock
-from common.base_agent import BaseAgent
+from common.base_agent import BaseAgent, raise_if_cancelled
 
 
 class MockAgent(BaseAgent):
@@ -49,3 +50,22 @@ class TestBaseAgent:
         assert result['status'] == 'error'
         assert result['error'] == 'Invalid input data'
         assert result['data'] is None
+    
+    def test_execute_reports_cancellation(self):
+        """Test that a set cancel token aborts the run with 'cancelled' status."""
+        
+        class CancellableAgent(MockAgent):
+            def run(self, input_data):
+                raise_if_cancelled()
+                return {'result': 'success'}
+        
+        agent = CancellableAgent(agent_name="test_agent")
+        cancel_token = threading.Event()
+        
+        result = agent.execute({'valid': True}, cancel_token=cancel_token)
+        assert result['status'] == 'success'
+        
+        cancel_token.set()
+        result = agent.execute({'valid': True}, cancel_token=cancel_token)
+        assert result['status'] == 'cancelled'
+        assert result['data'] is None
@@ -2,9 +2,8 @@
 Unit tests for Cache utility.
 """
 
+import threading
 import pytest
-from datetime import datetime, timedelta
-from freezegun import freeze_time
 from common.cache import Cache
 
 
@@ -30,9 +29,10 @@ class TestCache:
         key3 = cache.generate_key('test', value='test value')
         assert ' ' not in key3  # Spaces removed
     
-    def test_cache_get_set_and_ttl(self, isolated_cache):
+    def test_cache_get_set_and_ttl(self):
         """Test cache get, set, and TTL expiration."""
-        cache = isolated_cache
+        now = [0.0]
+        cache = Cache(time_fn=lambda: now[0])
         
         # Set a value
         cache.set('test_key', {'data': 'test_value'})
@@ -42,9 +42,48 @@ class TestCache:
         assert result == {'data': 'test_value'}
         
         # Test TTL expiration
-        with freeze_time(datetime.now() + timedelta(hours=4)):
-            # After 4 hours (exceeds 3-hour TTL), should return None
-            result = cache.get('test_key')
-            assert result is None
-            # Key should be deleted
-            assert 'test_key' not in cache._cache
+        now[0] += 4 * 3600
+        # After 4 hours (exceeds 3-hour TTL), should return None
+        result = cache.get('test_key')
+        assert result is None
+        # Key should be deleted
+        assert 'test_key' not in cache._cache
+    
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is evicted when the cache is full."""
+        cache = Cache(max_entries=2)
+        
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')  # 'b' is now least recently used
+        cache.set('c', 3)
+        
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+    
+    def test_cache_concurrent_expiry_and_eviction(self):
+        """Test that threads expiring and evicting the same keys don't raise."""
+        now = [0.0]
+        cache = Cache(max_entries=8, time_fn=lambda: now[0])
+        errors = []
+        
+        def worker(worker_id):
+            try:
+                for i in range(2000):
+                    key = f"key_{i % 16}"
+                    cache.set(key, (worker_id, i))
+                    if i % 50 == 0:
+                        now[0] += 4 * 3600  # Expire everything currently cached
+                    cache.get(key)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert len(cache._cache) <= cache.max_entries
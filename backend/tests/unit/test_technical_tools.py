@@ -0,0 +1,129 @@
+"""
+Unit tests for technical indicator math.
+Each indicator is checked against a pandas ewm/rolling reference, so the
+numpy fast paths (EMA dot product, fused MACD loop, tail-only RSI/SMA,
+length-grouped batches) cannot drift from the textbook definitions.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from agents.technical.technical_tools import (
+    calculate_macd,
+    calculate_moving_averages,
+    calculate_rsi,
+    compute_all_indicators,
+    compute_technical_analysis,
+    compute_technical_analysis_batch
+)
+
+_TOLERANCE = dict(rel=1e-9, abs=1e-9)
+
+
+def _price_series(n_bars, seed):
+    """Deterministic random-walk closing prices."""
+    rng = np.random.default_rng(seed)
+    return pd.Series(1000 + np.cumsum(rng.normal(0, 10, n_bars)))
+
+
+def _reference_indicators(prices):
+    """Indicators computed the plain pandas way (NaN-free values only)."""
+    delta = prices.diff()
+    avg_gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    avg_loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    
+    ema_12 = prices.ewm(span=12, adjust=False).mean()
+    ema_26 = prices.ewm(span=26, adjust=False).mean()
+    macd_line = ema_12 - ema_26
+    signal_line = macd_line.ewm(span=9, adjust=False).mean()
+    
+    n_bars = len(prices)
+    return {
+        'rsi': float(rsi.iloc[-1]),
+        'macd': float(macd_line.iloc[-1]) if n_bars >= 35 else None,
+        'macd_signal': float(signal_line.iloc[-1]) if n_bars >= 35 else None,
+        'macd_histogram': float((macd_line - signal_line).iloc[-1]) if n_bars >= 35 else None,
+        'sma_20': float(prices.rolling(window=20).mean().iloc[-1]),
+        'sma_50': float(prices.rolling(window=50).mean().iloc[-1]) if n_bars >= 50 else None,
+        'ema_12': float(ema_12.iloc[-1]),
+        'ema_26': float(ema_26.iloc[-1])
+    }
+
+
+def _assert_matches_reference(indicators, prices):
+    """Compare a TechnicalIndicators object field by field with the reference."""
+    for field, expected in _reference_indicators(prices).items():
+        actual = getattr(indicators, field)
+        if expected is None:
+            assert actual is None, field
+        else:
+            assert actual == pytest.approx(expected, **_TOLERANCE), field
+
+
+@pytest.mark.unit
+class TestIndicatorMath:
+    """Test single-series indicator functions against pandas."""
+    
+    @pytest.mark.parametrize("n_bars", [40, 63, 120])
+    def test_scalar_indicators_match_pandas(self, n_bars):
+        """Test RSI, MACD/signal and SMA/EMA helpers."""
+        prices = _price_series(n_bars, seed=n_bars)
+        expected = _reference_indicators(prices)
+        
+        assert calculate_rsi(prices) == pytest.approx(expected['rsi'], **_TOLERANCE)
+        
+        macd, signal, histogram = calculate_macd(prices)
+        assert macd == pytest.approx(expected['macd'], **_TOLERANCE)
+        assert signal == pytest.approx(expected['macd_signal'], **_TOLERANCE)
+        assert histogram == pytest.approx(expected['macd_histogram'], **_TOLERANCE)
+        
+        averages = calculate_moving_averages(prices)
+        for field in ('sma_20', 'sma_50', 'ema_12', 'ema_26'):
+            if expected[field] is None:
+                assert averages[field] is None
+            else:
+                assert averages[field] == pytest.approx(expected[field], **_TOLERANCE)
+    
+    def test_rsi_edge_cases(self):
+        """Test RSI without losses (100) and on a flat window (undefined)."""
+        assert calculate_rsi(pd.Series(np.arange(1.0, 31.0))) == 100.0
+        assert calculate_rsi(pd.Series(np.full(30, 50.0))) is None
+        assert calculate_rsi(pd.Series(np.arange(1.0, 15.0))) is None
+    
+    @pytest.mark.parametrize("n_bars", [35, 50, 90])
+    def test_compute_all_indicators_matches_pandas(self, n_bars):
+        """Test the single-stock path through the batched indicator kernel."""
+        prices = _price_series(n_bars, seed=100 + n_bars)
+        indicators = compute_all_indicators(prices.to_numpy(dtype=np.float64))
+        _assert_matches_reference(indicators, prices)
+
+
+@pytest.mark.unit
+class TestTechnicalAnalysisBatch:
+    """Test batched technical analysis against per-stock results."""
+    
+    def test_batch_with_mixed_history_lengths(self):
+        """Test that stocks grouped by history length keep their own full series."""
+        lengths = [60, 90, 60, 75, 90]
+        series = [_price_series(n, seed=i) for i, n in enumerate(lengths)]
+        stocks = [(f"SYM{i}.NS", f"Stock {i}", float(s.iloc[-1])) for i, s in enumerate(series)]
+        price_data = [pd.DataFrame({'Close': s}) for s in series]
+        
+        # Missing and too-short histories are skipped without affecting the others
+        stocks += [("NODATA.NS", "No Data", 100.0), ("SHORT.NS", "Short", 100.0)]
+        price_data += [None, pd.DataFrame({'Close': _price_series(30, seed=99)})]
+        
+        results = compute_technical_analysis_batch(stocks, price_data)
+        
+        assert len(results) == len(stocks)
+        assert results[-2] is None
+        assert results[-1] is None
+        for (symbol, name, current_price), data, result in zip(stocks, price_data, results[:-2]):
+            assert result.symbol == symbol
+            _assert_matches_reference(result.indicators, data['Close'])
+            
+            single = compute_technical_analysis(symbol, name, current_price, data)
+            assert result.trend == single.trend
+            assert result.strength == pytest.approx(single.strength, **_TOLERANCE)
+            assert result.recommendation == single.recommendation
@@ -3,30 +3,19 @@ Unit tests for Tool Registry.
 """
 
 import pytest
-from agents.sentiment.agent_tools import ToolRegistry, Tool
+from agents.sentiment.agent_tools import ToolRegistry
 
 
 @pytest.mark.unit
 class TestToolRegistry:
     """Test Tool Registry functionality."""
     
-    def test_tool_registration_and_retrieval(self):
+    def test_tool_registration_and_retrieval(self, fetch_news_tool):
         """Test registering and retrieving tools."""
         registry = ToolRegistry()
         
-        # Create a mock tool
-        def mock_function(symbol, days=14):
-            return [f"Article about {symbol}"]
-        
-        tool = Tool(
-            name="fetch_news",
-            description="Fetch news articles",
-            parameters={"type": "object", "properties": {"symbol": {"type": "string"}}},
-            function=mock_function
-        )
-        
         # Register tool
-        registry.register(tool)
+        registry.register(fetch_news_tool)
         
         # Retrieve tool
         retrieved = registry.get_tool("fetch_news")
@@ -34,26 +23,17 @@ class TestToolRegistry:
         assert retrieved.name == "fetch_news"
         assert retrieved.description == "Fetch news articles"
     
-    def test_tool_calling(self):
+    def test_tool_calling(self, base_registry):
         """Test calling a registered tool."""
-        registry = ToolRegistry()
-        
-        # Create and register a tool
-        def add_numbers(a, b):
-            return a + b
-        
-        tool = Tool(
-            name="add",
-            description="Add two numbers",
-            parameters={"type": "object"},
-            function=add_numbers
-        )
-        registry.register(tool)
-        
         # Call the tool
-        result = registry.call_tool("add", a=5, b=3)
+        result = base_registry.call_tool("add", a=5, b=3)
         assert result == 8
         
         # Test calling non-existent tool
         with pytest.raises(ValueError, match="Tool 'nonexistent' not found"):
-            registry.call_tool("nonexistent")
+            base_registry.call_tool("nonexistent")
+    
+    def test_tool_call_missing_required_argument(self, base_registry):
+        """Test that arguments marked required in the tool schema are enforced."""
+        with pytest.raises(ValueError, match="missing required arguments"):
+            base_registry.call_tool("add", a=5)